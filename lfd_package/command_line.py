@@ -5,7 +5,6 @@ Module Description:
 """
 
 import os.path
-import pint
 import pandas as pd
 import openpyxl
 from lfd_package.modules.__init__ import ureg, Q_
@@ -56,16 +55,8 @@ def run(args):
                                   grid_efficiency=data['grid_efficiency'], sim_ab_efficiency=data["energy_plus_eff"],
                                   winter_start_inclusive=data['winter_start_inclusive'],
                                   summer_start_inclusive=data['summer_start_inclusive'])
-    emissions_class = classes.Emissions(file_name=data['demand_filename'], city=data['city'], state=data['state'],
-                                        grid_efficiency=data['grid_efficiency'],
-                                        sim_ab_efficiency=data["energy_plus_eff"],
-                                        summer_start_inclusive=data['summer_start_inclusive'],
-                                        winter_start_inclusive=data['winter_start_inclusive'])
-    costs_class = classes.EnergyCosts(file_name=data['demand_filename'], city=data['city'], state=data['state'],
-                                      grid_efficiency=data['grid_efficiency'], no_apts=data['no_apts'],
-                                      winter_start_inclusive=data['winter_start_inclusive'],
-                                      summer_start_inclusive=data['summer_start_inclusive'],
-                                      sim_ab_efficiency=data["energy_plus_eff"], meter_type_el=data['meter_type_el'],
+    emissions_class = classes.Emissions()
+    costs_class = classes.EnergyCosts(no_apts=data['no_apts'], meter_type_el=data['meter_type_el'],
                                       meter_type_fuel=data['meter_type_fuel'],
                                       schedule_type_el=data['schedule_type_el'],
                                       schedule_type_fuel=data['schedule_type_fuel'],
@@ -73,21 +64,11 @@ def run(args):
                                       single_metered_el=data['single_metered_el'],
                                       master_metered_fuel=data['master_metered_fuel'],
                                       single_metered_fuel=data['single_metered_fuel'])
-    chp = classes.CHP(file_name=data['demand_filename'], city=data['city'], state=data['state'],
-                      grid_efficiency=data['grid_efficiency'], sim_ab_efficiency=data["energy_plus_eff"],
-                      summer_start_inclusive=data['summer_start_inclusive'],
-                      winter_start_inclusive=data['winter_start_inclusive'], turn_down_ratio=data['chp_turn_down'],
-                      chp_installed_cost=data['chp_installed_cost'], chp_om_cost=data['chp_om_cost'])
-    ab = classes.AuxBoiler(file_name=data['demand_filename'], city=data['city'], state=data['state'],
-                           grid_efficiency=data['grid_efficiency'],
-                           summer_start_inclusive=data['summer_start_inclusive'],
-                           winter_start_inclusive=data['winter_start_inclusive'],
-                           sim_ab_efficiency=data["energy_plus_eff"], efficiency=data['ab_eff'])
-    tes = classes.TES(file_name=data['demand_filename'], city=data['city'], state=data['state'],
-                      grid_efficiency=data['grid_efficiency'], sim_ab_efficiency=data["energy_plus_eff"],
-                      summer_start_inclusive=data['summer_start_inclusive'], start=data['tes_init'],
-                      winter_start_inclusive=data['winter_start_inclusive'],
-                      tes_installed_cost=data['tes_installed_cost'], tes_om_cost=data['tes_om_cost'])
+    chp = classes.CHP(turn_down_ratio=data['chp_turn_down'], chp_installed_cost=data['chp_installed_cost'],
+                      chp_om_cost=data['chp_om_cost'])
+    ab = classes.AuxBoiler(efficiency=data['ab_eff'])
+    tes = classes.TES(start=data['tes_init'], tes_installed_cost=data['tes_installed_cost'],
+                      tes_om_cost=data['tes_om_cost'])
 
     class_dict = {
         "demand": demand,
@@ -123,19 +104,28 @@ def main():
                         required=True)
     parser.set_defaults(func=run)
     args = parser.parse_args()
-    args.func(args)
 
     # Retrieve initialized class from run() function
-    class_dict = dict(run(args))
+    class_dict = dict(args.func(args))
 
     # Retrieve CHP sizes
     chp_size_tlf = sizing.size_chp(load_following_type='TLF', class_dict=class_dict)
     chp_size_elf = sizing.size_chp(load_following_type='ELF', class_dict=class_dict)
     chp_size_peak = sizing.size_chp(load_following_type='Peak', class_dict=class_dict)
 
-    # Initialize empty dictionaries
-    chp_gen_hourly_kwh_dict = {}
-    chp_gen_hourly_btuh_dict = {}
+    # Retrieve TES sizes
+    tes_size_tlf = sizing.size_tes(chp_size=chp_size_tlf, class_dict=class_dict)
+    tes_size_elf = sizing.size_tes(chp_size=chp_size_elf, class_dict=class_dict)
+    tes_size_peak = sizing.size_tes(chp_size=chp_size_peak, class_dict=class_dict)
+
+    # Hourly CHP generation for all scenarios
+    scenario_dict = cogen.calc_all_scenarios(chp_size_dict={"ELF": chp_size_elf, "TLF": chp_size_tlf,
+                                                            "Peak": chp_size_peak},
+                                             tes_size_dict={"ELF": tes_size_elf, "TLF": tes_size_tlf,
+                                                            "Peak": tes_size_peak},
+                                             class_dict=class_dict)
+    chp_gen_hourly_kwh_dict = {key: value["electricity_gen"] for key, value in scenario_dict.items()}
+    chp_gen_hourly_btuh_dict = {key: value["heat_gen"] for key, value in scenario_dict.items()}
 
     ##########################################################################################################
 
@@ -146,41 +136,30 @@ def main():
     ###########################
     # Electrical Energy Savings
     ###########################
-    elf_electric_gen_list = cogen.elf_calc_electricity_generated(chp_size=chp_size_elf, class_dict=class_dict)
+    elf_electric_gen_list = chp_gen_hourly_kwh_dict["ELF"]
     elf_electricity_bought_hourly = cogen.calc_electricity_bought(chp_size=chp_size_elf, class_dict=class_dict,
                                                                   chp_gen_hourly_kwh=elf_electric_gen_list)
 
     baseline_electric_energy_use = class_dict['demand'].annual_sum_el / class_dict['demand'].grid_efficiency
-    elf_electric_energy_use = sum(elf_electricity_bought_hourly) / class_dict['demand'].grid_efficiency
+    elf_electric_energy_use = elf_electricity_bought_hourly.sum() / class_dict['demand'].grid_efficiency
     elf_electric_energy_savings = (baseline_electric_energy_use - elf_electric_energy_use).to(ureg.kWh)
 
-    chp_gen_hourly_kwh_dict["ELF"] = elf_electric_gen_list
-
     ###########################
     # Thermal Demand Met by Equipment
     ###########################
-    elf_chp_gen_btuh = cogen.elf_calc_hourly_heat_generated(chp_gen_hourly_kwh=chp_gen_hourly_kwh_dict["ELF"],
-                                                            class_dict=class_dict)
-    chp_gen_hourly_btuh_dict["ELF"] = elf_chp_gen_btuh
-
-    # Retrieve TES Size
-    tes_size_elf = sizing.size_tes(chp_size=chp_size_elf, class_dict=class_dict)
+    elf_chp_gen_btuh = chp_gen_hourly_btuh_dict["ELF"]
 
     # Convert from power to energy
     elf_chp_gen_btu = class_dict['demand'].convert_units(units_to_str="Btu", values_list=elf_chp_gen_btuh)
-    elf_chp_thermal_gen = sum(elf_chp_gen_btu)
+    elf_chp_thermal_gen = elf_chp_gen_btu.sum()
 
     elf_tes_heat_flow_list, elf_tes_soc = \
         storage.calc_tes_heat_flow_and_soc(chp_gen_hourly_btuh=elf_chp_gen_btuh, tes_size=tes_size_elf,
                                            load_following_type="ELF", class_dict=class_dict)
 
     # Convert from power to energy
-    elf_tes_heat_flow_btu = \
-        class_dict['demand'].convert_units(units_to_str="Btu", values_list=elf_tes_heat_flow_list)
-    elf_tes_thermal_dispatch = -1 * sum([flow for flow in elf_tes_heat_flow_btu if flow.magnitude < 0])
-    if isinstance(elf_tes_thermal_dispatch, pint.Quantity) is False:
-        elf_tes_thermal_dispatch = Q_(elf_tes_thermal_dispatch, elf_tes_heat_flow_btu[0].units)
-    assert elf_tes_thermal_dispatch.units == ureg.Btu
+    elf_tes_heat_flow_btu = class_dict['demand'].convert_units(units_to_str="Btu", values_list=elf_tes_heat_flow_list)
+    elf_tes_thermal_dispatch = abs(elf_tes_heat_flow_btu[elf_tes_heat_flow_btu.magnitude < 0].sum())
 
     elf_boiler_dispatch_hourly = boiler.calc_aux_boiler_output_rate(chp_gen_hourly_btuh_dict=chp_gen_hourly_btuh_dict,
                                                                     chp_size=chp_size_elf, tes_size=tes_size_elf,
@@ -188,7 +167,7 @@ def main():
                                                                     tes_heat_flow_btuh=elf_tes_heat_flow_list)
     # Convert from power to energy
     elf_boiler_btu = class_dict["demand"].convert_units(units_to_str="Btu", values_list=elf_boiler_dispatch_hourly)
-    elf_boiler_dispatch = sum(elf_boiler_btu)
+    elf_boiler_dispatch = elf_boiler_btu.sum()
 
     ###########################
     # Thermal Energy Savings (current energy consumption - proposed energy consumption)
@@ -200,24 +179,20 @@ def main():
     elf_thermal_consumption_hourly_ab = boiler.calc_hourly_fuel_use(ab_output_rate_list=elf_boiler_dispatch_hourly,
                                                                     class_dict=class_dict)
 
-    elf_thermal_consumption_total = sum(elf_thermal_consumption_hourly_chp) + sum(elf_thermal_consumption_hourly_ab)
+    elf_chp_fuel_use_annual = elf_thermal_consumption_hourly_chp.sum()
+    elf_ab_fuel_use_annual = elf_thermal_consumption_hourly_ab.sum()
+    elf_thermal_consumption_total = elf_chp_fuel_use_annual + elf_ab_fuel_use_annual
     elf_thermal_energy_savings = thermal_consumption_baseline - elf_thermal_consumption_total
 
     ###########################
     # Thermal Cost Savings (current energy costs - proposed energy costs)
     ###########################
-    thermal_consumption_baseline_hourly = []
-    for item in class_dict['demand'].hl:
-        new_item = item / class_dict['ab'].eff
-        thermal_consumption_baseline_hourly.append(new_item)
+    thermal_consumption_baseline_hourly = class_dict['demand'].hl / class_dict['ab'].eff
 
     thermal_cost_baseline = costs.calc_fuel_charges(class_dict=class_dict,
                                                     fuel_bought_hourly=thermal_consumption_baseline_hourly)
 
-    elf_fuel_use_list = []
-    for index, item in enumerate(thermal_consumption_baseline_hourly):
-        hourly_fuel = elf_thermal_consumption_hourly_chp[index] + elf_thermal_consumption_hourly_ab[index]
-        elf_fuel_use_list.append(hourly_fuel)
+    elf_fuel_use_list = elf_thermal_consumption_hourly_chp + elf_thermal_consumption_hourly_ab
 
     elf_thermal_cost_total = costs.calc_fuel_charges(class_dict=class_dict, fuel_bought_hourly=elf_fuel_use_list)
 
@@ -225,7 +200,7 @@ def main():
     # Electrical Cost Savings
     ###########################
     electric_cost_baseline = costs.calc_electric_charges(class_dict=class_dict,
-                                                         electricity_bought_hourly=class_dict['costs'].el)
+                                                         electricity_bought_hourly=class_dict['demand'].el)
     elf_electric_cost_new = costs.calc_electric_charges(class_dict=class_dict,
                                                         electricity_bought_hourly=elf_electricity_bought_hourly)
 
@@ -250,36 +225,27 @@ def main():
     ###########################
     # Thermal Demand Met by Equipment
     ###########################
-    # Retrieve TES Size
-    tes_size_tlf = sizing.size_tes(chp_size=chp_size_tlf, class_dict=class_dict)
-
-    tlf_chp_gen_btuh, tlf_tes_heat_flow_list, tlf_tes_soc_list = \
-        cogen.tlf_calc_hourly_heat_chp_tes_soc(chp_size=chp_size_tlf, tes_size=tes_size_tlf, class_dict=class_dict)
-    chp_gen_hourly_btuh_dict["TLF"] = tlf_chp_gen_btuh
+    tlf_chp_gen_btuh = chp_gen_hourly_btuh_dict["TLF"]
+    tlf_tes_heat_flow_list = scenario_dict["TLF"]["tes_heat_flow"]
+    tlf_tes_soc_list = scenario_dict["TLF"]["tes_soc"]
 
     # Convert from power to energy
     tlf_chp_gen_btu = class_dict["demand"].convert_units(units_to_str="Btu", values_list=tlf_chp_gen_btuh)
-    tlf_chp_thermal_gen = sum(tlf_chp_gen_btu)
+    tlf_chp_thermal_gen = tlf_chp_gen_btu.sum()
 
     # Convert from power to energy
     tlf_tes_flow_btu = class_dict["demand"].convert_units(units_to_str="Btu", values_list=tlf_tes_heat_flow_list)
-    tlf_tes_thermal_dispatch = -1 * sum([item for item in tlf_tes_flow_btu if item.magnitude < 0])
-    if isinstance(tlf_tes_thermal_dispatch, pint.Quantity) is False:
-        tlf_tes_thermal_dispatch = Q_(tlf_tes_thermal_dispatch, tlf_tes_flow_btu[0].units)
-    assert tlf_tes_thermal_dispatch.units == ureg.Btu
+    tlf_tes_thermal_dispatch = abs(tlf_tes_flow_btu[tlf_tes_flow_btu.magnitude < 0].sum())
 
     ###########################
     # Electrical Energy Savings
     ###########################
-    tlf_electric_gen_list = \
-        cogen.tlf_calc_electricity_generated(chp_gen_hourly_btuh=chp_gen_hourly_btuh_dict["TLF"], class_dict=class_dict)
+    tlf_electric_gen_list = chp_gen_hourly_kwh_dict["TLF"]
     tlf_electricity_bought_hourly = cogen.calc_electricity_bought(chp_gen_hourly_kwh=tlf_electric_gen_list,
                                                                   chp_size=chp_size_tlf, class_dict=class_dict)
-    tlf_electric_energy_use = sum(tlf_electricity_bought_hourly) / class_dict['demand'].grid_efficiency
+    tlf_electric_energy_use = tlf_electricity_bought_hourly.sum() / class_dict['demand'].grid_efficiency
     tlf_electric_energy_savings = (baseline_electric_energy_use - tlf_electric_energy_use).to(ureg.kWh)
 
-    chp_gen_hourly_kwh_dict["TLF"] = tlf_electric_gen_list
-
     # Get Boiler Thermal Output
     tlf_boiler_dispatch_hourly = boiler.calc_aux_boiler_output_rate(tes_size=tes_size_tlf, chp_size=chp_size_tlf,
                                                                     class_dict=class_dict, load_following_type="TLF",
@@ -287,7 +253,7 @@ def main():
                                                                     tes_heat_flow_btuh=tlf_tes_heat_flow_list)
     # Convert from power to energy
     tlf_boiler_btu = class_dict["demand"].convert_units(units_to_str="Btu", values_list=tlf_boiler_dispatch_hourly)
-    tlf_boiler_dispatch = sum(tlf_boiler_btu)
+    tlf_boiler_dispatch = tlf_boiler_btu.sum()
 
     ###########################
     # Thermal Energy Savings (current energy consumption - proposed energy consumption)
@@ -297,17 +263,16 @@ def main():
     tlf_thermal_consumption_hourly_ab = \
         boiler.calc_hourly_fuel_use(ab_output_rate_list=tlf_boiler_dispatch_hourly, class_dict=class_dict)
 
-    tlf_thermal_consumption_total = sum(tlf_thermal_consumption_hourly_chp) + sum(tlf_thermal_consumption_hourly_ab)
+    tlf_chp_fuel_use_annual = tlf_thermal_consumption_hourly_chp.sum()
+    tlf_ab_fuel_use_annual = tlf_thermal_consumption_hourly_ab.sum()
+    tlf_thermal_consumption_total = tlf_chp_fuel_use_annual + tlf_ab_fuel_use_annual
     tlf_thermal_energy_savings = thermal_consumption_baseline - tlf_thermal_consumption_total
 
     ###########################
     # Thermal Cost Savings (current energy costs - proposed energy costs)
     ###########################
 
-    tlf_fuel_use_list = []
-    for index, item in enumerate(thermal_consumption_baseline_hourly):
-        hourly_fuel = tlf_thermal_consumption_hourly_chp[index] + tlf_thermal_consumption_hourly_ab[index]
-        tlf_fuel_use_list.append(hourly_fuel)
+    tlf_fuel_use_list = tlf_thermal_consumption_hourly_chp + tlf_thermal_consumption_hourly_ab
 
     tlf_thermal_cost_total = costs.calc_fuel_charges(class_dict=class_dict,
                                                      fuel_bought_hourly=tlf_fuel_use_list)
@@ -341,31 +306,24 @@ def main():
     ###########################
     # Electrical Energy Savings
     ###########################
-    peak_electric_gen_list, peak_electric_sold_list = cogen.pp_calc_electricity_gen_sold(chp_size=chp_size_peak,
-                                                                                         class_dict=class_dict)
+    peak_electric_gen_list = chp_gen_hourly_kwh_dict["Peak"]
+    peak_electric_sold_list = scenario_dict["Peak"]["electricity_sold"]
     peak_electricity_bought_hourly = cogen.calc_electricity_bought(chp_gen_hourly_kwh=peak_electric_gen_list,
                                                                    chp_size=chp_size_peak, class_dict=class_dict)
 
-    peak_electric_energy_use = sum(peak_electricity_bought_hourly) / class_dict['demand'].grid_efficiency
+    peak_electric_energy_use = peak_electricity_bought_hourly.sum() / class_dict['demand'].grid_efficiency
     peak_electric_energy_savings = baseline_electric_energy_use - peak_electric_energy_use
 
-    chp_gen_hourly_kwh_dict["Peak"] = peak_electric_gen_list
-
     ###########################
     # Thermal Demand Met by Equipment
     ###########################
-    peak_chp_gen_btuh = cogen.pp_calc_hourly_heat_generated(chp_gen_hourly_kwh=chp_gen_hourly_kwh_dict["Peak"],
-                                                            class_dict=class_dict)
+    peak_chp_gen_btuh = chp_gen_hourly_btuh_dict["Peak"]
     assert peak_chp_gen_btuh[0].units == ureg.Btu / ureg.hours
-    chp_gen_hourly_btuh_dict["Peak"] = peak_chp_gen_btuh
-
-    # Retrieve TES Size
-    tes_size_peak = sizing.size_tes(chp_size=chp_size_peak, class_dict=class_dict)
 
     # Convert from power to energy
     peak_chp_gen_btu = class_dict["demand"].convert_units(units_to_str="Btu", values_list=peak_chp_gen_btuh)
     assert peak_chp_gen_btu[0].units == ureg.Btu
-    peak_chp_thermal_gen = sum(peak_chp_gen_btu)
+    peak_chp_thermal_gen = peak_chp_gen_btu.sum()
     assert peak_chp_thermal_gen.units == ureg.Btu
 
     peak_tes_heat_flow_list, peak_tes_soc = \
@@ -373,10 +331,7 @@ def main():
                                            load_following_type="Peak", class_dict=class_dict)
     # Convert from power to energy
     peak_tes_flow_btu = class_dict["demand"].convert_units(units_to_str="Btu", values_list=peak_tes_heat_flow_list)
-    peak_tes_thermal_dispatch = -1 * sum([item for item in peak_tes_flow_btu if item.magnitude < 0])
-    if isinstance(peak_tes_thermal_dispatch, pint.Quantity) is False:
-        peak_tes_thermal_dispatch = Q_(peak_tes_thermal_dispatch, peak_tes_flow_btu[0].units)
-    assert peak_tes_thermal_dispatch.units == ureg.Btu
+    peak_tes_thermal_dispatch = abs(peak_tes_flow_btu[peak_tes_flow_btu.magnitude < 0].sum())
 
     peak_boiler_dispatch_hourly = boiler.calc_aux_boiler_output_rate(chp_gen_hourly_btuh_dict=chp_gen_hourly_btuh_dict,
                                                                      tes_size=tes_size_peak, chp_size=chp_size_peak,
@@ -384,7 +339,7 @@ def main():
                                                                      tes_heat_flow_btuh=peak_tes_heat_flow_list)
     # Convert from power to energy
     peak_boiler_btu = class_dict["demand"].convert_units(units_to_str="Btu", values_list=peak_boiler_dispatch_hourly)
-    peak_boiler_dispatch = sum(peak_boiler_btu)
+    peak_boiler_dispatch = peak_boiler_btu.sum()
 
     ###########################
     # Thermal Energy Savings (current energy consumption - proposed energy consumption)
@@ -395,16 +350,15 @@ def main():
     peak_thermal_consumption_hourly_ab = \
         boiler.calc_hourly_fuel_use(ab_output_rate_list=peak_boiler_dispatch_hourly, class_dict=class_dict)
 
-    peak_thermal_consumption_total = sum(peak_thermal_consumption_hourly_chp) + sum(peak_thermal_consumption_hourly_ab)
+    peak_chp_fuel_use_annual = peak_thermal_consumption_hourly_chp.sum()
+    peak_ab_fuel_use_annual = peak_thermal_consumption_hourly_ab.sum()
+    peak_thermal_consumption_total = peak_chp_fuel_use_annual + peak_ab_fuel_use_annual
     peak_thermal_energy_savings = thermal_consumption_baseline - peak_thermal_consumption_total
 
     ###########################
     # Thermal Cost Savings (current energy costs - proposed energy costs)
     ###########################
-    peak_fuel_use_list = []
-    for index, item in enumerate(peak_thermal_consumption_hourly_chp):
-        hourly_fuel = peak_thermal_consumption_hourly_chp[index] + peak_thermal_consumption_hourly_ab[index]
-        peak_fuel_use_list.append(hourly_fuel)
+    peak_fuel_use_list = peak_thermal_consumption_hourly_chp + peak_thermal_consumption_hourly_ab
 
     peak_thermal_cost_total = costs.calc_fuel_charges(class_dict=class_dict, fuel_bought_hourly=peak_fuel_use_list)
 
@@ -443,16 +397,16 @@ def main():
     tes_size_elf.ito(ureg.kWh)
     tes_size_tlf.ito(ureg.kWh)
     tes_size_peak.ito(ureg.kWh)
-    peak_hl_annual = class_dict['ab'].annual_peak_hl.to(ureg.kW)
+    peak_hl_annual = class_dict['demand'].annual_peak_hl.to(ureg.kW)
 
     # Energy Generation Calcs
-    chp_el_cov_elf = round((sum(elf_electric_gen_list) / class_dict['demand'].annual_sum_el) * 100, 2)
-    chp_el_cov_tlf = round((sum(tlf_electric_gen_list) / class_dict['demand'].annual_sum_el) * 100, 2)
-    chp_el_cov_peak = round((sum(peak_electric_gen_list) / class_dict['demand'].annual_sum_el) * 100, 2)
+    chp_el_cov_elf = round((elf_electric_gen_list.sum() / class_dict['demand'].annual_sum_el) * 100, 2)
+    chp_el_cov_tlf = round((tlf_electric_gen_list.sum() / class_dict['demand'].annual_sum_el) * 100, 2)
+    chp_el_cov_peak = round((peak_electric_gen_list.sum() / class_dict['demand'].annual_sum_el) * 100, 2)
 
-    bought_el_cov_elf = round((sum(elf_electricity_bought_hourly) / class_dict['demand'].annual_sum_el) * 100, 2)
-    bought_el_cov_tlf = round((sum(tlf_electricity_bought_hourly) / class_dict['demand'].annual_sum_el) * 100, 2)
-    bought_el_cov_peak = round((sum(peak_electricity_bought_hourly) / class_dict['demand'].annual_sum_el) * 100, 2)
+    bought_el_cov_elf = round((elf_electricity_bought_hourly.sum() / class_dict['demand'].annual_sum_el) * 100, 2)
+    bought_el_cov_tlf = round((tlf_electricity_bought_hourly.sum() / class_dict['demand'].annual_sum_el) * 100, 2)
+    bought_el_cov_peak = round((peak_electricity_bought_hourly.sum() / class_dict['demand'].annual_sum_el) * 100, 2)
 
     chp_th_cov_elf = round((elf_chp_thermal_gen / class_dict['demand'].annual_sum_hl) * 100, 2)
     chp_th_cov_tlf = round((tlf_chp_thermal_gen / class_dict['demand'].annual_sum_hl) * 100, 2)
@@ -466,11 +420,11 @@ def main():
     ab_th_cov_tlf = round((tlf_boiler_dispatch / class_dict['demand'].annual_sum_hl) * 100, 2)
     ab_th_cov_peak = round((peak_boiler_dispatch / class_dict['demand'].annual_sum_hl) * 100, 2)
 
-    elf_annual_electricity_bought = sum(elf_electricity_bought_hourly)
-    tlf_annual_electricity_bought = sum(tlf_electricity_bought_hourly)
-    peak_annual_electricity_bought = sum(peak_electricity_bought_hourly)
-    tlf_annual_electricity_sold = sum(tlf_electricity_sold)
-    peak_annual_electricity_sold = sum(peak_electric_sold_list)
+    elf_annual_electricity_bought = elf_electricity_bought_hourly.sum()
+    tlf_annual_electricity_bought = tlf_electricity_bought_hourly.sum()
+    peak_annual_electricity_bought = peak_electricity_bought_hourly.sum()
+    tlf_annual_electricity_sold = tlf_electricity_sold.sum()
+    peak_annual_electricity_sold = peak_electric_sold_list.sum()
     elf_chp_thermal_gen.ito(ureg.kWh)
     tlf_chp_thermal_gen.ito(ureg.kWh)
     peak_chp_thermal_gen.ito(ureg.kWh)
@@ -496,17 +450,17 @@ def main():
     baseline_total_co2 = emissions.calc_baseline_fuel_emissions(class_dict=class_dict) + \
                          emissions.calc_baseline_grid_emissions(class_dict=class_dict)
 
-    tlf_total_co2 = emissions.calc_chp_emissions(electricity_bought_annual=sum(tlf_electricity_bought_hourly),
-                                                 chp_fuel_use_annual=sum(tlf_thermal_consumption_hourly_chp),
-                                                 ab_fuel_use_annual=sum(tlf_thermal_consumption_hourly_ab),
+    tlf_total_co2 = emissions.calc_chp_emissions(electricity_bought_annual=tlf_electricity_bought_hourly.sum(),
+                                                 chp_fuel_use_annual=tlf_chp_fuel_use_annual,
+                                                 ab_fuel_use_annual=tlf_ab_fuel_use_annual,
                                                  class_dict=class_dict)
-    elf_total_co2 = emissions.calc_chp_emissions(electricity_bought_annual=sum(elf_electricity_bought_hourly),
-                                                 chp_fuel_use_annual=sum(elf_thermal_consumption_hourly_chp),
-                                                 ab_fuel_use_annual=sum(elf_thermal_consumption_hourly_ab),
+    elf_total_co2 = emissions.calc_chp_emissions(electricity_bought_annual=elf_electricity_bought_hourly.sum(),
+                                                 chp_fuel_use_annual=elf_chp_fuel_use_annual,
+                                                 ab_fuel_use_annual=elf_ab_fuel_use_annual,
                                                  class_dict=class_dict)
-    peak_total_co2 = emissions.calc_chp_emissions(electricity_bought_annual=sum(peak_electricity_bought_hourly),
-                                                  chp_fuel_use_annual=sum(peak_thermal_consumption_hourly_chp),
-                                                  ab_fuel_use_annual=sum(peak_thermal_consumption_hourly_ab),
+    peak_total_co2 = emissions.calc_chp_emissions(electricity_bought_annual=peak_electricity_bought_hourly.sum(),
+                                                  chp_fuel_use_annual=peak_chp_fuel_use_annual,
+                                                  ab_fuel_use_annual=peak_ab_fuel_use_annual,
                                                   class_dict=class_dict)
 
     baseline_total_co2.ito(ureg.metric_ton)
@@ -550,9 +504,9 @@ def main():
         # Energy Generation Data
         ###########################
         ["CHP Electrical Energy Generation", "N/A", "N/A",
-         round(sum(elf_electric_gen_list).magnitude, 2), elf_electric_gen_list[0].units,
-         round(sum(tlf_electric_gen_list).magnitude, 2), tlf_electric_gen_list[0].units,
-         round(sum(peak_electric_gen_list).magnitude, 2), peak_electric_gen_list[0].units],
+         round(elf_electric_gen_list.sum().magnitude, 2), elf_electric_gen_list[0].units,
+         round(tlf_electric_gen_list.sum().magnitude, 2), tlf_electric_gen_list[0].units,
+         round(peak_electric_gen_list.sum().magnitude, 2), peak_electric_gen_list[0].units],
         ["Electrical Energy Bought", "N/A", "N/A",
          round(elf_annual_electricity_bought.magnitude, 2), elf_annual_electricity_bought.units,
          round(tlf_annual_electricity_bought.magnitude, 2), tlf_annual_electricity_bought.units,
@@ -4,6 +4,7 @@ Module Description:
     by the auxiliary boiler
 """
 
+import numpy as np
 from lfd_package.modules.__init__ import ureg, Q_
 
 
@@ -17,7 +18,7 @@ def calc_aux_boiler_output_rate(chp_size=None, tes_size=None, chp_gen_hourly_btu
 
     Parameters
     ---------
-    tes_heat_flow_btuh: list
+    tes_heat_flow_btuh: numpy.ndarray (Quantity)
         contains hourly heat flow into and out of the TES system. Negative values indicate dispatched heat.
         Units are in Btu/hr.
     class_dict: dict
@@ -35,40 +36,33 @@ def calc_aux_boiler_output_rate(chp_size=None, tes_size=None, chp_gen_hourly_btu
 
     Returns
     -------
-    ab_heat_rate_hourly: list (Quantity)
+    ab_heat_rate_hourly: numpy.ndarray (Quantity)
         Hourly heat output of the auxiliary boiler in units of Btu/hr
     """
-    args_list = [chp_size, tes_size, chp_gen_hourly_btuh_dict, load_following_type, class_dict, tes_heat_flow_btuh]
-    if any(elem is None for elem in args_list) is False:
-        # Pull chp heat and tes heat data
-        chp_heat_flow_btuh = chp_gen_hourly_btuh_dict[str(load_following_type)]
-        dem_heat_flow_btuh = class_dict['demand'].hl
-        boiler_size = class_dict['demand'].annual_peak_hl
-        ab_heat_rate_hourly = []
+    if (chp_size is None or tes_size is None or chp_gen_hourly_btuh_dict is None or load_following_type is None or
+            class_dict is None or tes_heat_flow_btuh is None):
+        raise TypeError("calc_aux_boiler_output_rate() missing a required argument")
+    btu_per_hour = ureg.Btu / ureg.hour
 
-        # Compare CHP and TES output with demand to determine AB output
-        for index in range(len(dem_heat_flow_btuh)):
-            dem_btuh = dem_heat_flow_btuh[index]
-            chp_btuh = chp_heat_flow_btuh[index]
-            tes_btuh = -1 * tes_heat_flow_btuh[index]  # Negative if heat is dispatched. Dispatch is now turned positive
-            chp_tes_sum = chp_btuh + tes_btuh
+    # Pull chp heat and tes heat data
+    chp_heat_flow_btuh = chp_gen_hourly_btuh_dict[str(load_following_type)].to(btu_per_hour).magnitude
+    dem_heat_flow_btuh = class_dict['demand'].hl_btu_hr
+    boiler_size = class_dict['demand'].annual_peak_hl.to(btu_per_hour).magnitude
 
-            if dem_btuh <= chp_tes_sum:
-                ab_heat_rate_item = Q_(0, ureg.Btu / ureg.hour)
-                ab_heat_rate_hourly.append(ab_heat_rate_item)
-            elif chp_tes_sum < dem_btuh:
-                ab_heat_rate_item = dem_btuh - chp_tes_sum
+    # Compare CHP and TES output with demand to determine AB output
+    tes_btuh = -1 * tes_heat_flow_btuh.to(btu_per_hour).magnitude  # Dispatch (negative) is now turned positive
+    chp_tes_sum = chp_heat_flow_btuh + tes_btuh
+    ab_heat_rate_hourly = np.maximum(dem_heat_flow_btuh - chp_tes_sum, 0)
 
-                # Check that hourly heat demand is within aux boiler operating parameters
-                if boiler_size < ab_heat_rate_item:
-                    short = round(abs(ab_heat_rate_item - boiler_size), 2)
-                    raise Exception('ALERT: Boiler size is insufficient to meet heating demand! Output is short by '
-                                    '{} at hour number {}'.format(short, index))
-                else:
-                    ab_heat_rate_hourly.append(ab_heat_rate_item)
+    # Check that hourly heat demand is within aux boiler operating parameters
+    if np.any(boiler_size < ab_heat_rate_hourly):
+        index = np.argmax(boiler_size < ab_heat_rate_hourly)
+        short = round(Q_(abs(ab_heat_rate_hourly[index] - boiler_size), btu_per_hour), 2)
+        raise Exception('ALERT: Boiler size is insufficient to meet heating demand! Output is short by '
+                        '{} at hour number {}'.format(short, index))
 
-        assert len(ab_heat_rate_hourly) == 8760
-        return ab_heat_rate_hourly
+    assert len(ab_heat_rate_hourly) == 8760
+    return Q_(ab_heat_rate_hourly, btu_per_hour)
 
 
 def calc_hourly_fuel_use(ab_output_rate_list=None, class_dict=None):
@@ -77,22 +71,20 @@ def calc_hourly_fuel_use(ab_output_rate_list=None, class_dict=None):
 
     Parameters
     ----------
-    ab_output_rate_list: list
+    ab_output_rate_list: numpy.ndarray (Quantity)
         contains hourly heat generation of the auxiliary boiler.
     class_dict: dict
         contains initialized class data using CLI inputs (see command_line.py)
 
     Returns
     -------
-    hourly_fuel_use_btu: list
+    hourly_fuel_use_btu: numpy.ndarray (Quantity)
         hourly fuel use of the auxiliary boiler in units of Btu
     """
-    args_list = [ab_output_rate_list, class_dict]
-    if any(elem is None for elem in args_list) is False:
-        # Fuel use calculation
-        hourly_fuel_use_btu = []
-        for item in ab_output_rate_list:
-            fuel_use = (item * Q_(1, ureg.hour)) / class_dict['ab'].eff
-            hourly_fuel_use_btu.append(fuel_use.to(ureg.Btu))
+    if ab_output_rate_list is None or class_dict is None:
+        raise TypeError("calc_hourly_fuel_use() missing a required argument")
+    # Fuel use calculation. Heat rate in Btu/hr over a one hour step is numerically equal to Btu
+    ab_output_btu = ab_output_rate_list.to(ureg.Btu / ureg.hour).magnitude
+    hourly_fuel_use_btu = Q_(ab_output_btu / class_dict['ab'].eff, ureg.Btu)
 
-        return hourly_fuel_use_btu
+    return hourly_fuel_use_btu
@@ -6,9 +6,14 @@ Module Description:
 """
 
 import math
+import numpy as np
 from lfd_package.modules import sizing_calcs as sizing
 from lfd_package.modules.__init__ import ureg, Q_
 
+# Conversion factors between electrical (kW) and thermal (Btu/hr) rates
+_KW_TO_BTUH = Q_(1, ureg.kW).to(ureg.Btu / ureg.hour).magnitude
+_BTUH_TO_KW = 1 / _KW_TO_BTUH
+
 
 def calc_hourly_fuel_use(chp_size=None, class_dict=None, chp_electric_gen_hourly_kwh=None):
     """
@@ -22,26 +27,22 @@ def calc_hourly_fuel_use(chp_size=None, class_dict=None, chp_electric_gen_hourly
         contains initialized class data using CLI inputs (see command_line.py)
     chp_size: Quantity
         contains size of CHP in units of kW.
-    chp_electric_gen_hourly_kwh: list
-        contains lists of hourly chp electricity generated in kWh.
+    chp_electric_gen_hourly_kwh: numpy.ndarray (Quantity)
+        contains hourly chp electricity generated in kWh.
 
     Returns
     -------
-    fuel_use_btu_list: list
+    fuel_use_btu_list: numpy.ndarray (Quantity)
         Annual, hourly fuel use in units of Btu.
     """
-    args_list = [chp_size, chp_electric_gen_hourly_kwh, class_dict]
-    if any(elem is None for elem in args_list) is False:
-        fuel_use_btu_list = []
-
-        # Calculate fuel use
-        for index, el in enumerate(chp_electric_gen_hourly_kwh):
-            chp_hourly_electric_kw = (el / Q_(1, ureg.hours)).to(ureg.kW)
-            fuel_use_hourly_kw = sizing.electrical_output_to_fuel_consumption(chp_hourly_electric_kw)
-            fuel_use_hourly_btu = (fuel_use_hourly_kw * Q_(1, ureg.hours)).to(ureg.Btu)
-            fuel_use_btu_list.append(fuel_use_hourly_btu)
+    if chp_size is None or chp_electric_gen_hourly_kwh is None or class_dict is None:
+        raise TypeError("calc_hourly_fuel_use() missing a required argument")
+    # Calculate fuel use
+    chp_hourly_electric_kw = Q_(chp_electric_gen_hourly_kwh.to(ureg.kWh).magnitude, ureg.kW)
+    fuel_use_hourly_kw = sizing.electrical_output_to_fuel_consumption(chp_hourly_electric_kw)
+    fuel_use_btu_list = Q_(fuel_use_hourly_kw.magnitude * _KW_TO_BTUH, ureg.Btu)
 
-        return fuel_use_btu_list
+    return fuel_use_btu_list
 
 
 def calc_electricity_bought(chp_gen_hourly_kwh=None, chp_size=None, class_dict=None):
@@ -50,8 +51,8 @@ def calc_electricity_bought(chp_gen_hourly_kwh=None, chp_size=None, class_dict=N
 
     Parameters
     ----------
-    chp_gen_hourly_kwh: list
-        contains lists of hourly chp electricity generated in kWh.
+    chp_gen_hourly_kwh: numpy.ndarray (Quantity)
+        contains hourly chp electricity generated in kWh.
     chp_size: Quantity
         contains size of CHP in units of kW.
     class_dict: dict
@@ -59,26 +60,17 @@ def calc_electricity_bought(chp_gen_hourly_kwh=None, chp_size=None, class_dict=N
 
     Returns
     -------
-    bought_kwh_list: list
+    bought_kwh_list: numpy.ndarray (Quantity)
         contains hourly electricity bought in kWh.
     """
-    args_list = [chp_gen_hourly_kwh, chp_size, class_dict]
-    if any(elem is None for elem in args_list) is False:
-
-        bought_kwh_list = []
-
-        for index, dem_kw in enumerate(class_dict['demand'].el):
-            dem_kwh = (dem_kw * Q_(1, ureg.hours)).to(ureg.kWh)
-            gen_kwh = chp_gen_hourly_kwh[index]
-
-            if gen_kwh < dem_kwh:
-                bought = dem_kwh - gen_kwh
-                bought_kwh_list.append(bought)
-            else:
-                bought = Q_(0, ureg.kWh)
-                bought_kwh_list.append(bought)
+    if chp_gen_hourly_kwh is None or chp_size is None or class_dict is None:
+        raise TypeError("calc_electricity_bought() missing a required argument")
+    # Hourly demand in kW is numerically equal to hourly energy in kWh
+    dem_kwh = class_dict['demand'].el_kw
+    gen_kwh = chp_gen_hourly_kwh.to(ureg.kWh).magnitude
 
-        return bought_kwh_list
+    bought_kwh_list = Q_(np.maximum(dem_kwh - gen_kwh, 0.0), ureg.kWh)
+    return bought_kwh_list
 
 
 """
@@ -100,34 +92,28 @@ def pp_calc_electricity_gen_sold(chp_size=None, class_dict=None):
 
     Returns
     -------
-    chp_gen_kwh_list: list
+    chp_gen_kwh_list: numpy.ndarray (Quantity)
         contains electricity generated hourly by CHP in units of kWh.
-    chp_sold_kwh_list: list
+    chp_sold_kwh_list: numpy.ndarray (Quantity)
         contains excess electricity generated hourly by CHP and sold to grid.
         Units are in kWh.
     """
-    args_list = [chp_size, class_dict]
-    if any(elem is None for elem in args_list) is False:
+    if chp_size is None or class_dict is None:
+        raise TypeError("pp_calc_electricity_gen_sold() missing a required argument")
 
-        chp_hourly_kwh = (chp_size * Q_(1, ureg.hours)).to(ureg.kWh)
-        chp_min_gen_kw = chp_size * class_dict['chp'].min_pl
-        chp_gen_kwh_list = []
-        chp_sold_kwh_list = []
+    dem_kw = class_dict['demand'].el_kw
+    chp_size_kw = chp_size.to(ureg.kW).magnitude
+    chp_min_gen_kw = chp_size_kw * class_dict['chp'].min_pl
 
-        for dem in class_dict['demand'].el:
-            dem_kwh = (dem * Q_(1, ureg.hours)).to(ureg.kWh)
+    if not np.all(dem_kw <= chp_size_kw):
+        raise Exception("CHP not sized to peak electrical demand")
 
-            # Electricity gen and sold calcs
-            if chp_min_gen_kw <= dem <= chp_size:
-                chp_gen_kwh_list.append(chp_hourly_kwh)
-                chp_sold_kwh_list.append(chp_hourly_kwh - dem_kwh)
-            elif dem < chp_min_gen_kw:
-                chp_gen_kwh_list.append(Q_(0, ureg.kWh))
-                chp_sold_kwh_list.append(Q_(0, ureg.kWh))
-            else:
-                raise Exception("CHP not sized to peak electrical demand")
+    # Electricity gen and sold calcs. CHP runs at full capacity unless demand is below min output
+    chp_on = chp_min_gen_kw <= dem_kw
+    chp_gen_kwh_list = np.where(chp_on, chp_size_kw, 0.0)
+    chp_sold_kwh_list = np.where(chp_on, chp_size_kw - dem_kw, 0.0)
 
-        return chp_gen_kwh_list, chp_sold_kwh_list
+    return Q_(chp_gen_kwh_list, ureg.kWh), Q_(chp_sold_kwh_list, ureg.kWh)
 
 
 def pp_calc_hourly_heat_generated(chp_gen_hourly_kwh=None, class_dict=None):
@@ -136,27 +122,24 @@ def pp_calc_hourly_heat_generated(chp_gen_hourly_kwh=None, class_dict=None):
 
     Parameters
     ----------
-    chp_gen_hourly_kwh: list
+    chp_gen_hourly_kwh: numpy.ndarray (Quantity)
         contains electricity generated hourly by CHP in units of kWh.
     class_dict: dict
         contains initialized class data using CLI inputs (see command_line.py)
 
     Returns
     -------
-    hourly_heat_rate: list
+    hourly_heat_rate: numpy.ndarray (Quantity)
         contains hourly thermal energy generated by CHP. Units are Btu/hr.
     """
-    args_list = [chp_gen_hourly_kwh, class_dict]
-    if any(elem is None for elem in args_list) is False:
-        hourly_heat_rate = []
+    if chp_gen_hourly_kwh is None or class_dict is None:
+        raise TypeError("pp_calc_hourly_heat_generated() missing a required argument")
+    # Energy over a one-hour step is numerically equal to the average rate
+    el_gen = Q_(chp_gen_hourly_kwh.to(ureg.kWh).magnitude, ureg.kW)
+    heat_kw = sizing.electrical_output_to_thermal_output(el_gen)
+    hourly_heat_rate = Q_(heat_kw.magnitude * _KW_TO_BTUH, ureg.Btu / ureg.hour)
 
-        for i, el_gen_kwh in enumerate(chp_gen_hourly_kwh):
-            el_gen = (el_gen_kwh / Q_(1, ureg.hours)).to(ureg.kW)
-            heat_kw = sizing.electrical_output_to_thermal_output(el_gen)
-            heat = heat_kw.to(ureg.Btu / ureg.hour)
-            hourly_heat_rate.append(heat)
-
-        return hourly_heat_rate
+    return hourly_heat_rate
 
 
 """
@@ -184,33 +167,23 @@ def elf_calc_electricity_generated(chp_size=None, class_dict=None):
 
     Returns
     -------
-    chp_gen_kwh_list: list
-        contains Quantity float values for electricity generated hourly in units of kWh.
+    chp_gen_kwh_list: numpy.ndarray (Quantity)
+        contains electricity generated hourly in units of kWh.
     """
-    args_list = [chp_size, class_dict]
-    if any(elem is None for elem in args_list) is False:
-        chp_gen_kwh_list = []
-
-        chp_min_output = (class_dict['chp'].min_pl * chp_size).to(ureg.kW)
+    if chp_size is None or class_dict is None:
+        raise TypeError("elf_calc_electricity_generated() missing a required argument")
+    dem_kw = class_dict['demand'].el_kw
+    # Verifies acceptable input value range
+    assert np.all(dem_kw >= 0)
 
-        for dem in class_dict['demand'].el:
-            # Verifies acceptable input value range
-            assert dem.magnitude >= 0
-            dem_kw = dem.to(ureg.kW)
+    chp_size_kw = chp_size.to(ureg.kW).magnitude
+    chp_min_output = class_dict['chp'].min_pl * chp_size_kw
 
-            if chp_min_output <= dem_kw <= chp_size:
-                gen = (dem_kw * Q_(1, ureg.hour)).to(ureg.kWh)
-                chp_gen_kwh_list.append(gen)
-            elif dem_kw < chp_min_output:
-                gen = Q_(0, ureg.kWh)
-                chp_gen_kwh_list.append(gen)
-            elif chp_size < dem_kw:
-                gen = (chp_size * Q_(1, ureg.hour)).to(ureg.kWh)
-                chp_gen_kwh_list.append(gen)
-            else:
-                raise Exception("Error in ELF calc_utility_electricity_needed function")
+    # Follow the load up to capacity, and shut off below minimum output
+    chp_gen_kwh_list = np.minimum(dem_kw, chp_size_kw)
+    chp_gen_kwh_list[dem_kw < chp_min_output] = 0
 
-        return chp_gen_kwh_list
+    return Q_(chp_gen_kwh_list, ureg.kWh)
 
 
 def elf_calc_hourly_heat_generated(chp_gen_hourly_kwh=None, class_dict=None):
@@ -224,28 +197,24 @@ def elf_calc_hourly_heat_generated(chp_gen_hourly_kwh=None, class_dict=None):
 
     Parameters
     ---------
-    chp_gen_hourly_kwh: list
+    chp_gen_hourly_kwh: numpy.ndarray (Quantity)
         contains CHP electricity generated hourly in units of kWh.
     class_dict: dict
         contains initialized class data using CLI inputs (see command_line.py).
 
     Returns
     -------
-    hourly_heat_rate: list
-        Contains Quantity float values for hourly thermal output of the CHP unit
-        in units of Btu/hour
+    hourly_heat_rate: numpy.ndarray (Quantity)
+        Contains hourly thermal output of the CHP unit in units of Btu/hour
     """
-    args_list = [chp_gen_hourly_kwh, class_dict]
-    if any(elem is None for elem in args_list) is False:
-        hourly_heat_rate = []
-
-        for i, el_gen_kwh in enumerate(chp_gen_hourly_kwh):
-            el_gen = (el_gen_kwh / Q_(1, ureg.hours)).to(ureg.kW)
-            heat_kw = sizing.electrical_output_to_thermal_output(el_gen)
-            heat = heat_kw.to(ureg.Btu / ureg.hour)
-            hourly_heat_rate.append(heat)
+    if chp_gen_hourly_kwh is None or class_dict is None:
+        raise TypeError("elf_calc_hourly_heat_generated() missing a required argument")
+    # Energy over a one-hour step is numerically equal to the average rate
+    el_gen = Q_(chp_gen_hourly_kwh.to(ureg.kWh).magnitude, ureg.kW)
+    heat_kw = sizing.electrical_output_to_thermal_output(el_gen)
+    hourly_heat_rate = Q_(heat_kw.magnitude * _KW_TO_BTUH, ureg.Btu / ureg.hour)
 
-        return hourly_heat_rate
+    return hourly_heat_rate
 
 
 """
@@ -253,6 +222,63 @@ TLF Functions
 """
 
 
+def _tlf_heat_tes_soc_kernel(heat_demand, chp_heat_rate_min, chp_heat_rate_cap, tes_size, tes_is_empty,
+                             current_status):
+    """
+    Hourly CHP heat and TES dispatch loop used by tlf_calc_hourly_heat_chp_tes_soc.
+
+    Works on plain floats: heat rates are in Btu/hr and storage is in Btu, which are
+    numerically equal over a one hour time step.
+    """
+    chp_hourly_heat_rate_list = np.zeros(len(heat_demand))
+    tes_heat_rate_list_btu_hour = np.zeros(len(heat_demand))
+    soc_list = np.zeros(len(heat_demand))
+
+    for i, dem in enumerate(heat_demand):
+        # Pick the CHP operating point. Only the case where demand exceeds both the CHP
+        # capacity and the stored heat drains the TES outright.
+        drain_tes = False
+        if chp_heat_rate_min <= dem <= chp_heat_rate_cap and tes_size == current_status:
+            # If TES is full and chp meets demand, follow thermal load
+            gen = dem
+        elif chp_heat_rate_min <= dem <= chp_heat_rate_cap and current_status < tes_size:
+            # If TES needs heat and chp meets demand, run CHP at full power and put excess in TES
+            gen = chp_heat_rate_cap
+        elif dem < chp_heat_rate_min and dem <= current_status:
+            # If TES not empty, then let out heat to meet demand
+            gen = 0.0
+        elif chp_heat_rate_min > dem > current_status:
+            # If TES is empty (or does not have enough to meet demand), then run CHP at full power
+            gen = chp_heat_rate_cap
+        elif chp_heat_rate_cap < dem < current_status:
+            # If demand exceeds CHP generation, use TES
+            gen = chp_heat_rate_cap
+        elif chp_heat_rate_cap < dem and current_status < dem:
+            # Discharge everything from TES
+            gen = chp_heat_rate_cap
+            drain_tes = True
+        else:
+            raise Exception("Error in TLF calc_utility_electricity_needed function")
+        chp_hourly_heat_rate_list[i] = gen
+
+        # Handle condition of TES size being zero
+        if tes_is_empty:
+            continue
+
+        # Charge or discharge the TES by the CHP surplus or deficit, clipped so the SOC stays
+        # between 0 and 1
+        tes_heat = gen - dem
+        if drain_tes or current_status + tes_heat <= 0:
+            tes_heat = -1 * current_status
+        elif current_status + tes_heat >= tes_size:
+            tes_heat = tes_size - current_status
+        tes_heat_rate_list_btu_hour[i] = tes_heat
+        current_status = tes_heat + current_status
+        soc_list[i] = current_status / tes_size
+
+    return chp_hourly_heat_rate_list, tes_heat_rate_list_btu_hour, soc_list
+
+
 def tlf_calc_hourly_heat_chp_tes_soc(chp_size=None, tes_size=None, class_dict=None):
     """
     Calculates the hourly CHP heat generated, hourly TES heat rate, and TES
@@ -278,151 +304,40 @@ def tlf_calc_hourly_heat_chp_tes_soc(chp_size=None, tes_size=None, class_dict=No
 
     Returns
     -------
-    chp_hourly_heat_rate_list: list
-        contains Quantity float values for hourly heat generated by the CHP
-        system in units of Btu/hour.
-    tes_heat_rate_list_btu_hour: list
-        contains Quantities for hourly TES thermal dispatch or charging.
-        Discharging is negative while charging is positive. Units are Btu/hr.
-    soc_list: list
-        contains dimensionless Quantity float values representing percent charge
-        of thermal storage for each hour.
+    chp_hourly_heat_rate_list: numpy.ndarray (Quantity)
+        contains hourly heat generated by the CHP system in units of Btu/hour.
+    tes_heat_rate_list_btu_hour: numpy.ndarray (Quantity)
+        contains hourly TES thermal dispatch or charging. Discharging is
+        negative while charging is positive. Units are Btu/hr.
+    soc_list: numpy.ndarray (Quantity)
+        contains dimensionless values representing percent charge of thermal
+        storage for each hour.
 
     """
-    args_list = [chp_size, tes_size, class_dict]
-    if any(elem is None for elem in args_list) is False:
-        chp_min_output = (class_dict['chp'].min_pl * chp_size).to(ureg.kW)
-
-        chp_hourly_heat_rate_list = []
-        chp_heat_rate_min = (sizing.electrical_output_to_thermal_output(chp_min_output)).to(ureg.Btu / ureg.hour)
-        chp_heat_rate_cap = sizing.electrical_output_to_thermal_output(chp_size).to(ureg.Btu / ureg.hour)
-
-        tes_heat_rate_list_btu_hour = []
-        soc_list = []
-
-        for i, dem in enumerate(class_dict['demand'].hl):
-            # Verifies acceptable input value range
-            assert dem.magnitude >= 0
-            if i == 0:
-                current_status = class_dict['tes'].start * tes_size
-
-            if chp_heat_rate_min <= dem <= chp_heat_rate_cap and tes_size == current_status:
-                # If TES is full and chp meets demand, follow thermal load
-                gen = dem.to(ureg.Btu / ureg.hour)
-                chp_hourly_heat_rate_list.append(gen)
-
-                # Handle condition of TES size being zero
-                if math.isclose(tes_size.magnitude, 0):
-                    tes_heat_rate_list_btu_hour.append(Q_(0, ureg.Btu / ureg.hours))
-                    soc_list.append(Q_(0, ''))
-                else:
-                    stored_heat = Q_(0, ureg.Btu / ureg.hour)
-                    tes_heat_rate_list_btu_hour.append(stored_heat)
-                    new_status = (stored_heat * Q_(1, ureg.hour)) + current_status
-                    soc_list.append(new_status / tes_size)
-                    current_status = new_status
-            elif chp_heat_rate_min <= dem <= chp_heat_rate_cap and current_status < tes_size:
-                # If TES needs heat and chp meets demand, run CHP at full power and put excess in TES
-                gen = chp_heat_rate_cap
-                chp_hourly_heat_rate_list.append(gen)
-
-                # Handle condition of TES size being zero
-                if math.isclose(tes_size.magnitude, 0):
-                    tes_heat_rate_list_btu_hour.append(Q_(0, ureg.Btu / ureg.hours))
-                    soc_list.append(Q_(0, ''))
-                else:
-                    # Make sure SOC does not exceed 1 when heat is added
-                    soc_check = ((current_status / Q_(1, ureg.hours)) + gen - dem) / (tes_size / Q_(1, ureg.hours))
-                    if soc_check.magnitude < 1:
-                        stored_heat = gen - dem
-                        assert stored_heat >= 0
-                    else:
-                        stored_heat = (tes_size - current_status) / Q_(1, ureg.hours)
-                        assert stored_heat >= 0
-                    tes_heat_rate_list_btu_hour.append(stored_heat)
-                    new_status = (stored_heat * Q_(1, ureg.hours)) + current_status
-                    soc_list.append(new_status / tes_size)
-                    current_status = new_status
-            elif dem < chp_heat_rate_min and dem <= (current_status / Q_(1, ureg.hours)):
-                # If TES not empty, then let out heat to meet demand
-                gen = Q_(0, ureg.Btu / ureg.hour)
-                chp_hourly_heat_rate_list.append(gen)
-
-                # Handle condition of TES size being zero
-                if math.isclose(tes_size.magnitude, 0):
-                    tes_heat_rate_list_btu_hour.append(Q_(0, ureg.Btu / ureg.hours))
-                    soc_list.append(Q_(0, ''))
-                else:
-                    discharged_heat = gen - dem     # Should be negative
-                    assert discharged_heat <= 0
-                    tes_heat_rate_list_btu_hour.append(discharged_heat)
-                    new_status = (discharged_heat * Q_(1, ureg.hours)) + current_status
-                    soc_list.append(new_status / tes_size)
-                    current_status = new_status
-            elif chp_heat_rate_min > dem > (current_status / Q_(1, ureg.hours)):
-                # If TES is empty (or does not have enough to meet demand), then run CHP at full power
-                gen = chp_heat_rate_cap
-                chp_hourly_heat_rate_list.append(gen)
-
-                # Handle condition of TES size being zero
-                if math.isclose(tes_size.magnitude, 0):
-                    tes_heat_rate_list_btu_hour.append(Q_(0, ureg.Btu / ureg.hours))
-                    soc_list.append(Q_(0, ''))
-                else:
-                    soc_check = ((current_status / Q_(1, ureg.hours)) + gen - dem) / (tes_size / Q_(1, ureg.hours))
-                    if soc_check >= 1:
-                        stored_heat = (tes_size - current_status) / Q_(1, ureg.hours)
-                        assert stored_heat >= 0
-                    else:
-                        stored_heat = gen - dem
-                        assert stored_heat >= 0
-
-                    new_status = (stored_heat * Q_(1, ureg.hour)) + current_status
-                    tes_heat_rate_list_btu_hour.append(stored_heat)
-                    soc_list.append(new_status / tes_size)
-                    current_status = new_status
-            elif chp_heat_rate_cap < dem < (current_status / Q_(1, ureg.hours)):
-                # If demand exceeds CHP generation, use TES
-                gen = chp_heat_rate_cap
-                chp_hourly_heat_rate_list.append(gen)
-
-                # Handle condition of TES size being zero
-                if math.isclose(tes_size.magnitude, 0):
-                    tes_heat_rate_list_btu_hour.append(Q_(0, ureg.Btu / ureg.hours))
-                    soc_list.append(Q_(0, ''))
-                else:
-                    soc_check = ((current_status / Q_(1, ureg.hours)) + gen - dem) / (tes_size / Q_(1, ureg.hours))
-                    if soc_check <= 0:
-                        discharged_heat = -1 * current_status / Q_(1, ureg.hours)
-                        assert discharged_heat <= 0
-                    else:
-                        discharged_heat = gen - dem     # Should be negative
-                        assert discharged_heat <= 0
-
-                    tes_heat_rate_list_btu_hour.append(discharged_heat)
-                    new_status = (discharged_heat * Q_(1, ureg.hour)) + current_status
-                    soc_list.append(new_status / tes_size)
-                    current_status = new_status
-            elif chp_heat_rate_cap < dem and (current_status / Q_(1, ureg.hours)) < dem:
-                # Discharge everything from TES
-                gen = chp_heat_rate_cap
-                chp_hourly_heat_rate_list.append(gen)
-
-                # Handle condition of TES size being zero
-                if math.isclose(tes_size.magnitude, 0):
-                    tes_heat_rate_list_btu_hour.append(Q_(0, ureg.Btu / ureg.hours))
-                    soc_list.append(Q_(0, ''))
-                else:
-                    discharged_heat = -1 * current_status / Q_(1, ureg.hours)  # Should be negative
-                    assert discharged_heat <= 0
-                    tes_heat_rate_list_btu_hour.append(discharged_heat)
-                    new_status = (discharged_heat * Q_(1, ureg.hours)) + current_status
-                    soc_list.append(new_status / tes_size)
-                    current_status = new_status
-            else:
-                raise Exception("Error in TLF calc_utility_electricity_needed function")
-
-        return chp_hourly_heat_rate_list, tes_heat_rate_list_btu_hour, soc_list
+    if chp_size is None or tes_size is None or class_dict is None:
+        raise TypeError("tlf_calc_hourly_heat_chp_tes_soc() missing a required argument")
+    btu_per_hour = ureg.Btu / ureg.hour
+
+    chp_min_output = (class_dict['chp'].min_pl * chp_size).to(ureg.kW)
+    chp_heat_rate_min = (sizing.electrical_output_to_thermal_output(chp_min_output)).to(btu_per_hour).magnitude
+    chp_heat_rate_cap = sizing.electrical_output_to_thermal_output(chp_size).to(btu_per_hour).magnitude
+
+    # Verifies acceptable input value range
+    heat_demand = class_dict['demand'].hl_btu_hr
+    assert np.all(heat_demand >= 0)
+
+    tes_size_btu = tes_size.to(ureg.Btu).magnitude
+    tes_is_empty = math.isclose(tes_size_btu, 0)
+    current_status = class_dict['tes'].start * tes_size_btu
+
+    chp_hourly_heat_rate_list, tes_heat_rate_list_btu_hour, soc_list = \
+        _tlf_heat_tes_soc_kernel(heat_demand, chp_heat_rate_min, chp_heat_rate_cap,
+                                 tes_size_btu, tes_is_empty, current_status)
+
+    chp_hourly_heat_rate_list = Q_(chp_hourly_heat_rate_list, btu_per_hour)
+    tes_heat_rate_list_btu_hour = Q_(tes_heat_rate_list_btu_hour, btu_per_hour)
+    soc_list = Q_(soc_list, '')
+    return chp_hourly_heat_rate_list, tes_heat_rate_list_btu_hour, soc_list
 
 
 def tlf_calc_electricity_generated(chp_gen_hourly_btuh=None, class_dict=None):
@@ -434,27 +349,23 @@ def tlf_calc_electricity_generated(chp_gen_hourly_btuh=None, class_dict=None):
 
     Parameters
     ----------
-    chp_gen_hourly_btuh: list
-        contains lists of hourly chp heat generated in Btu/hr.
+    chp_gen_hourly_btuh: numpy.ndarray (Quantity)
+        contains hourly chp heat generated in Btu/hr.
     class_dict: dict
         contains initialized class data using CLI inputs (see command_line.py).
 
     Returns
     -------
-    hourly_electricity_gen: list
-        contains Quantity float values for CHP electricity generated each hour in
-        units of kWh
+    hourly_electricity_gen: numpy.ndarray (Quantity)
+        contains CHP electricity generated each hour in units of kWh
     """
-    args_list = [chp_gen_hourly_btuh, class_dict]
-    if any(elem is None for elem in args_list) is False:
-        hourly_electricity_gen = []
-
-        for i, hourly_heat_rate in enumerate(chp_gen_hourly_btuh):
-            heat_gen_kw = hourly_heat_rate.to(ureg.kW)
-            electric_gen_kwh = (sizing.thermal_output_to_electrical_output(heat_gen_kw) * Q_(1, ureg.hour)).to(ureg.kWh)
-            hourly_electricity_gen.append(electric_gen_kwh)
+    if chp_gen_hourly_btuh is None or class_dict is None:
+        raise TypeError("tlf_calc_electricity_generated() missing a required argument")
+    heat_gen_kw = Q_(chp_gen_hourly_btuh.to(ureg.Btu / ureg.hour).magnitude * _BTUH_TO_KW, ureg.kW)
+    electric_gen_kw = sizing.thermal_output_to_electrical_output(heat_gen_kw)
+    hourly_electricity_gen = Q_(electric_gen_kw.magnitude, ureg.kWh)
 
-        return hourly_electricity_gen
+    return hourly_electricity_gen
 
 
 def tlf_calc_electricity_sold(chp_gen_hourly_kwh=None, class_dict=None):
@@ -462,31 +373,78 @@ def tlf_calc_electricity_sold(chp_gen_hourly_kwh=None, class_dict=None):
 
     Parameters
     ----------
-    chp_gen_hourly_kwh: list
+    chp_gen_hourly_kwh: numpy.ndarray (Quantity)
         contains CHP electricity generated hourly in units of kWh.
     class_dict: dict
         contains initialized class data using CLI inputs (see command_line.py).
 
     Returns
     -------
-    sold_kwh_list: list
+    sold_kwh_list: numpy.ndarray (Quantity)
         contains hourly electricity sold to the grid in units of kWh.
     """
-    args_list = [chp_gen_hourly_kwh, class_dict]
-    if any(elem is None for elem in args_list) is False:
-        dem_el_list = class_dict['demand'].el
-        sold_kwh_list = []
-
-        for index, dem in enumerate(dem_el_list):
-            dem_kwh = (dem * Q_(1, ureg.hours)).to(ureg.kWh)
-            chp_gen_kwh = chp_gen_hourly_kwh[index]
-
-            # Electricity gen and sold calcs
-            if dem_kwh < chp_gen_kwh:
-                sold_kwh = chp_gen_kwh - dem_kwh
-                sold_kwh_list.append(sold_kwh)
-            else:
-                sold_kwh = Q_(0, ureg.kWh)
-                sold_kwh_list.append(sold_kwh)
-
-        return sold_kwh_list
+    if chp_gen_hourly_kwh is None or class_dict is None:
+        raise TypeError("tlf_calc_electricity_sold() missing a required argument")
+    # Hourly demand in kW is numerically equal to hourly energy in kWh
+    dem_kwh = class_dict['demand'].el_kw
+    chp_gen_kwh = chp_gen_hourly_kwh.to(ureg.kWh).magnitude
+
+    sold_kwh_list = Q_(np.maximum(chp_gen_kwh - dem_kwh, 0.0), ureg.kWh)
+    return sold_kwh_list
+
+
+"""
+All Scenarios
+"""
+
+
+def calc_all_scenarios(chp_size_dict=None, tes_size_dict=None, class_dict=None):
+    """
+    Calculates hourly CHP electricity and heat generation for the ELF, TLF, and
+    Peak (PP) scenarios in a single pass over the shared hourly demand data.
+
+    Used in the command_line.py module
+
+    Parameters
+    ----------
+    chp_size_dict: dict
+        contains CHP size in units of kW for each scenario, keyed by
+        "ELF", "TLF", and "Peak".
+    tes_size_dict: dict
+        contains TES size in units of Btu for each scenario, keyed by
+        "ELF", "TLF", and "Peak".
+    class_dict: dict
+        contains initialized class data using CLI inputs (see command_line.py).
+
+    Returns
+    -------
+    scenario_dict: dict
+        keyed by scenario. Each entry contains hourly CHP electricity generated
+        ("electricity_gen", kWh) and heat generated ("heat_gen", Btu/hr). The TLF
+        entry also contains hourly TES heat flow ("tes_heat_flow", Btu/hr) and
+        SOC ("tes_soc"), and the Peak entry contains hourly electricity sold
+        ("electricity_sold", kWh).
+    """
+    if chp_size_dict is None or tes_size_dict is None or class_dict is None:
+        raise TypeError("calc_all_scenarios() missing a required argument")
+
+    elf_electric_gen = elf_calc_electricity_generated(chp_size=chp_size_dict["ELF"], class_dict=class_dict)
+    elf_heat_gen = elf_calc_hourly_heat_generated(chp_gen_hourly_kwh=elf_electric_gen, class_dict=class_dict)
+
+    tlf_heat_gen, tlf_tes_heat_flow, tlf_tes_soc = \
+        tlf_calc_hourly_heat_chp_tes_soc(chp_size=chp_size_dict["TLF"], tes_size=tes_size_dict["TLF"],
+                                         class_dict=class_dict)
+    tlf_electric_gen = tlf_calc_electricity_generated(chp_gen_hourly_btuh=tlf_heat_gen, class_dict=class_dict)
+
+    peak_electric_gen, peak_electric_sold = pp_calc_electricity_gen_sold(chp_size=chp_size_dict["Peak"],
+                                                                         class_dict=class_dict)
+    peak_heat_gen = pp_calc_hourly_heat_generated(chp_gen_hourly_kwh=peak_electric_gen, class_dict=class_dict)
+
+    scenario_dict = {
+        "ELF": {"electricity_gen": elf_electric_gen, "heat_gen": elf_heat_gen},
+        "TLF": {"electricity_gen": tlf_electric_gen, "heat_gen": tlf_heat_gen,
+                "tes_heat_flow": tlf_tes_heat_flow, "tes_soc": tlf_tes_soc},
+        "Peak": {"electricity_gen": peak_electric_gen, "heat_gen": peak_heat_gen,
+                 "electricity_sold": peak_electric_sold}
+    }
+    return scenario_dict
@@ -8,9 +8,43 @@ import math
 import pathlib
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
+from functools import cached_property, lru_cache
 from lfd_package.modules.__init__ import ureg, Q_
 
+# Units used when building demand profiles and equipment classes
+_J_PER_HR = ureg.joules / ureg.hour
+_BTU_PER_HR = ureg.Btu / ureg.hour
+_KW = ureg.kW
+_KWH = ureg.kWh
+_BTU = ureg.Btu
+_ONE_HOUR = Q_(1, ureg.hours)
+
+# Cached EnergyDemand properties that depend on the season boundaries
+_SEASONAL_PROPERTIES = ("_seasonal_weights_el", "_seasonal_weights_hl", "summer_weight_el", "winter_weight_el",
+                        "summer_weight_hl", "winter_weight_hl")
+
+# Demand profiles are 8760 hour typical years, so month lengths are fixed to a non-leap year
+_DAYS_IN_MONTH = np.array([31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31], dtype=np.int8)
+
+# Location of the demand profile .csv files
+_INPUT_DIR = pathlib.Path(__file__).resolve().parent.parent / 'input_demand_profiles'
+
+# Columns read from the EnergyPlus demand profile .csv files
+_DEMAND_COLUMNS = ("Date/Time", "Electricity:Facility [J](Hourly)", "Gas:Facility [J](Hourly)")
+_METERING_DTYPES = {"Electricity:Facility [J](Hourly)": np.float64,
+                    "Gas:Facility [J](Hourly)": np.float64,
+                    "Gas:Facility [J](Hourly) ": np.float64}
+
+
+@lru_cache(maxsize=None)
+def _read_demand_profile(file_path, modified_time):
+    # Cached on file path and modification time so that classes built from the
+    # same demand profile during one run only parse the .csv file once. Only the
+    # metering columns are parsed; some files pad the gas column name with a space.
+    df = pd.read_csv(file_path, usecols=lambda name: name.strip() in _DEMAND_COLUMNS, dtype=_METERING_DTYPES,
+                     engine='c')
+    return df.rename(columns=str.strip)
+
 
 class EnergyDemand:
     def __init__(self, file_name='default_file.csv', city=None, state=None, grid_efficiency=None,
@@ -45,33 +79,27 @@ class EnergyDemand:
             may be modified as needed.
         """
         # Reads load profile data from .csv file
-        cwd = pathlib.Path(__file__).parent.parent.resolve() / 'input_demand_profiles'
+        cwd = _INPUT_DIR
         self.demand_file_name = file_name
-        df = pd.read_csv(cwd / file_name)
+        file_path = cwd / file_name
+        df = _read_demand_profile(file_path, file_path.stat().st_mtime)
 
         # Plucks electrical metering data from the file using row and column locations
         electric_metering_df = df["Electricity:Facility [J](Hourly)"]
-        electric_demand_hourly = electric_metering_df.to_numpy()
+        electric_demand_hourly = electric_metering_df.to_numpy(dtype=float)
 
         # Plucks thermal metering data from the file using row and column locations
-        try:
-            heating_metering_df = df["Gas:Facility [J](Hourly)"]
-        except KeyError:
-            heating_metering_df = df["Gas:Facility [J](Hourly) "]
-        heating_metering_hourly = heating_metering_df.to_numpy()
+        heating_metering_df = df["Gas:Facility [J](Hourly)"]
+        heating_metering_hourly = heating_metering_df.to_numpy(dtype=float)
 
         # Plucks month numbers from metering data file
-        meter_dates_array = df["Date/Time"].to_numpy(dtype=str)
-        meter_months_hourly = []
-        for item in meter_dates_array:
-            date = self.standardize_date_str(date_str=item)
-            meter_months_hourly.append(date.month)
-
-        self.meter_months_hourly = np.array(meter_months_hourly, dtype=int)
+        self.meter_months_hourly = self.parse_meter_months(date_series=df["Date/Time"])
+        # Index of the first hour of each contiguous run of hours belonging to the same month
+        self.meter_month_starts_hourly = np.concatenate(([0], np.flatnonzero(np.diff(self.meter_months_hourly)) + 1))
         self.sim_ab_efficiency = float(sim_ab_efficiency)
 
         # Convert heat metering to heating demand using EnergyPlus assumed heating efficiency value
-        heating_demand_hourly = [item * self.sim_ab_efficiency for item in heating_metering_hourly]
+        heating_demand_hourly = heating_metering_hourly * self.sim_ab_efficiency
 
         ##############################
         # General Info
@@ -85,224 +113,235 @@ class EnergyDemand:
         self.grid_efficiency = float(grid_efficiency)
 
         # Energy Costs - Seasonal
-        self.summer_start_month = int(summer_start_inclusive)
-        self.winter_start_month = int(winter_start_inclusive)
+        self.configure_season(summer_start_inclusive=summer_start_inclusive,
+                              winter_start_inclusive=winter_start_inclusive)
 
         ################################
         # Energy Demand Info
         ################################
 
-        # Annual and monthly peaks and sums
-        heat_load_joules = self.convert_to_float_numpy(heating_demand_hourly) * (ureg.joules / ureg.hour)
-        electric_load_joules = self.convert_to_float_numpy(electric_demand_hourly) * (ureg.joules / ureg.hour)
+        # Hourly demand profiles, each a single Quantity wrapping an ndarray
+        heat_load_joules = Q_(heating_demand_hourly, _J_PER_HR)
+        electric_load_joules = Q_(electric_demand_hourly, _J_PER_HR)
+
+        self.hl = heat_load_joules.to(_BTU_PER_HR)
+        self.el = electric_load_joules.to(_KW)
+
+        # Unitless copies of the hourly demand, used by the hourly calculations in chp.py
+        self.hl_btu_hr = self.hl.magnitude
+        self.el_kw = self.el.magnitude
+
+    #####################################
+    # Demand Aggregates
+    #####################################
+
+    # Computed on first access and cached, so callers that only need the hourly
+    # profiles do not pay for the aggregations
+
+    @cached_property
+    def _seasonal_weights_el(self):
+        return self.seasonal_weights_hourly_data(dem_profile=self.el)
+
+    @cached_property
+    def _seasonal_weights_hl(self):
+        return self.seasonal_weights_hourly_data(dem_profile=self.hl)
+
+    @cached_property
+    def summer_weight_el(self):
+        return self._seasonal_weights_el[0]
+
+    @cached_property
+    def winter_weight_el(self):
+        return self._seasonal_weights_el[1]
+
+    @cached_property
+    def summer_weight_hl(self):
+        return self._seasonal_weights_hl[0]
+
+    @cached_property
+    def winter_weight_hl(self):
+        return self._seasonal_weights_hl[1]
+
+    # Hourly rates over a one hour time step are numerically equal to hourly energy
 
-        self.hl = heat_load_joules.to(ureg.Btu / ureg.hours)
-        self.el = electric_load_joules.to(ureg.kW)
+    @cached_property
+    def annual_sum_el(self):
+        return Q_(self.el_kw.sum(), _KWH)
 
-        self.summer_weight_el, self.winter_weight_el = self.seasonal_weights_hourly_data(dem_profile=self.el)
-        self.summer_weight_hl, self.winter_weight_hl = self.seasonal_weights_hourly_data(dem_profile=self.hl)
+    @cached_property
+    def annual_sum_hl(self):
+        return Q_(self.hl_btu_hr.sum(), _BTU)
 
-        sum_kw = sum(self.el) * Q_(1, ureg.hours)
-        self.annual_sum_el = sum_kw.to(ureg.kWh)
-        sum_btuh = sum(self.hl) * Q_(1, ureg.hours)
-        self.annual_sum_hl = sum_btuh.to(ureg.Btu)
+    @cached_property
+    def annual_peak_hl(self):
+        return Q_(self.hl_btu_hr.max(), _BTU_PER_HR)
 
-        self.annual_peak_hl = max(self.hl)
-        self.annual_peak_el = max(self.el)
+    @cached_property
+    def annual_peak_el(self):
+        return Q_(self.el_kw.max(), _KW)
 
-        self.monthly_peaks_list_el = self.monthly_demand_peaks(dem_profile=self.el)
-        self.monthly_peaks_list_hl = self.monthly_demand_peaks(dem_profile=self.hl)
+    @cached_property
+    def monthly_peaks_list_el(self):
+        return self.monthly_demand_peaks(dem_profile=self.el)
 
-        self.monthly_sums_list_el = self.monthly_energy_sums(dem_profile=self.el)
-        self.monthly_sums_list_hl = self.monthly_energy_sums(dem_profile=self.hl)
+    @cached_property
+    def monthly_peaks_list_hl(self):
+        return self.monthly_demand_peaks(dem_profile=self.hl)
+
+    @cached_property
+    def monthly_sums_list_el(self):
+        return self.monthly_energy_sums(dem_profile=self.el)
+
+    @cached_property
+    def monthly_sums_list_hl(self):
+        return self.monthly_energy_sums(dem_profile=self.hl)
 
     #####################################
     # Methods
     #####################################
 
-    def standardize_date_str(self, date_str):
-        assert isinstance(date_str, str)
-        date_list = date_str.split()
-        year = datetime.now().year
-        new_date = "{}/{} {}".format(date_list[0], year, date_list[1])
-        try:
-            new_datetime = datetime.strptime(new_date, '%m/%d/%Y %H:%M:%S')
-        except ValueError:
-            rollback_str = new_date.replace(' 24', ' 23')
-            rollback_datetime = datetime.strptime(rollback_str, '%m/%d/%Y %H:%M:%S')
-            new_datetime = rollback_datetime + timedelta(hours=1)
-        return new_datetime
+    def configure_season(self, summer_start_inclusive=None, winter_start_inclusive=None):
+        """
+        Sets the months summer and winter start for utility billing purposes. Can be called
+        again after construction to study other season boundaries without re-reading the
+        demand profile.
+
+        Parameters
+        ----------
+        summer_start_inclusive: int
+            Integer value between 1-12 (Jan-Dec) indicating the month summer starts for utility
+            billing purposes.
+        winter_start_inclusive: int
+            See above.
+        """
+        if summer_start_inclusive is None or winter_start_inclusive is None:
+            raise TypeError("configure_season() missing a required argument")
+        self.summer_start_month = int(summer_start_inclusive)
+        self.winter_start_month = int(winter_start_inclusive)
+        self.summer_mask_hourly = ((self.summer_start_month <= self.meter_months_hourly) &
+                                   (self.meter_months_hourly < self.winter_start_month))
+        self.winter_mask_hourly = ~self.summer_mask_hourly
+
+        # Seasonal weights from the previous season boundaries are recomputed on next access
+        for name in _SEASONAL_PROPERTIES:
+            self.__dict__.pop(name, None)
+
+    def parse_meter_months(self, date_series=None):
+        # EnergyPlus timestamps look like " 01/01  24:00:00" and have no year. Only the month
+        # is needed, so it is read straight from the "MM/DD" field without building datetimes.
+        date_parts = date_series.str.split(expand=True)
+        months = date_parts[0].str[:2].astype(np.int8).to_numpy()
+        days = date_parts[0].str[3:5].astype(np.int8).to_numpy()
+
+        # Hour 24 on the last day of a month is the first hour of the next month
+        rollover = date_parts[1].str.startswith('24').to_numpy() & (days == _DAYS_IN_MONTH[months - 1])
+        return np.where(rollover, months % 12 + 1, months).astype(np.int8)
 
     def convert_units(self, values_list=None, units_to_str=None):
         assert 1 < len(values_list)
-        converted_list = []
-        if values_list[0].check('[power]'):
-            for item in values_list:
-                new_item = item * Q_(1, ureg.hours)
-                new_item.to(units_to_str)
-                assert new_item.check('[energy]')
-                converted_list.append(new_item)
-        elif values_list[0].check('[energy]'):
-            for item in values_list:
-                new_item = item / Q_(1, ureg.hours)
-                new_item.to(units_to_str)
-                assert new_item.check('[power]')
-                converted_list.append(new_item)
+        # Lists of scalar quantities are packed into a single array so the whole
+        # profile is converted in one operation
+        if not isinstance(values_list, Q_):
+            values_list = Q_.from_list(list(values_list))
+        if values_list.check('[power]'):
+            converted = (values_list * _ONE_HOUR).to(units_to_str)
+            assert converted.check('[energy]')
+        elif values_list.check('[energy]'):
+            converted = (values_list / _ONE_HOUR).to(units_to_str)
+            assert converted.check('[power]')
         else:
             raise Exception('only converts between kWh and kW units')
-        return converted_list
-
-    def convert_to_float_numpy(self, array=None):
-        float_list = []
-        for item in array:
-            f = float(item)
-            float_list.append(f)
-        float_array = np.array(float_list, dtype=float)
-        return float_array
+        return converted
 
     def seasonal_weights_hourly_data(self, dem_profile=None):
-        summer_start = int(self.summer_start_month)
-        winter_start = int(self.winter_start_month)
-        month_list = self.meter_months_hourly
-        summer_index_list = []
-        winter_index_list = []
-
-        for index, i in enumerate(month_list):
-            if summer_start <= int(i) < winter_start:
-                summer_index_list.append(index)
-            else:
-                winter_index_list.append(index)
-
-        summer_weight_list = []
-        for index in summer_index_list:
-            item = (dem_profile[index] * Q_(1, ureg.hours)).to_reduced_units()
-            summer_weight_list.append(item)
-
-        winter_weight_list = []
-        for index in winter_index_list:
-            item = (dem_profile[index] * Q_(1, ureg.hours)).to_reduced_units()
-            winter_weight_list.append(item)
-
-        summer_sum = sum(summer_weight_list)    # Has power or energy units
-        winter_sum = sum(winter_weight_list)
-
-        if summer_sum == 0:
-            summer_sum = Q_(summer_sum, winter_sum.units)
-        elif winter_sum == 0:
-            winter_sum = Q_(winter_sum, summer_sum.units)
-        total = (sum(dem_profile) * Q_(1, ureg.hours)).to_reduced_units()
-        assert math.isclose(summer_sum.magnitude + winter_sum.magnitude, total.magnitude)
-
-        if math.isclose(total.magnitude, 0) is False:
-            summer_weight = summer_sum / total
-            winter_weight = winter_sum / total
+        # Each hourly value is weighted by the same one hour time step, so the
+        # seasonal weights can be taken directly from the magnitudes
+        profile = np.asarray(dem_profile.magnitude)
+        summer_sum = profile[self.summer_mask_hourly].sum()
+        winter_sum = profile[self.winter_mask_hourly].sum()
+        # The masks partition the profile, so the seasons add up to the annual total
+        total = summer_sum + winter_sum
+
+        if not math.isclose(total, 0):
+            summer_weight = Q_(summer_sum / total, '')
+            winter_weight = Q_(winter_sum / total, '')
             return summer_weight, winter_weight
         else:
             return Q_(0, ''), Q_(0, '')
 
     def seasonal_weights_monthly_data(self, monthly_data=None):
-        summer_start = int(self.summer_start_month)
-        winter_start = int(self.winter_start_month)
-        summer_index_list = []
-        winter_index_list = []
-
-        for index, item in enumerate(monthly_data):
-            if summer_start <= int(index+1) < winter_start:
-                summer_index_list.append(index)
-            else:
-                winter_index_list.append(index)
-
-        summer_weight_list = []
-        for index in summer_index_list:
-            item = monthly_data[index]
-            summer_weight_list.append(item)
-
-        winter_weight_list = []
-        for index in winter_index_list:
-            item = monthly_data[index]
-            winter_weight_list.append(item)
-
-        summer_sum = sum(summer_weight_list)
-        winter_sum = sum(winter_weight_list)
-        total = sum(monthly_data)
-        assert math.isclose(summer_sum.magnitude + winter_sum.magnitude, total.magnitude)
-
-        if math.isclose(total.magnitude, 0) is False:
-            summer_weight = summer_sum / total
-            winter_weight = winter_sum / total
+        # Lists of scalar quantities are packed into a single array before masking by month
+        if not isinstance(monthly_data, Q_):
+            monthly_data = Q_.from_list(list(monthly_data))
+        months = np.arange(1, len(monthly_data) + 1)
+        summer_mask = (self.summer_start_month <= months) & (months < self.winter_start_month)
+
+        profile = np.asarray(monthly_data.magnitude)
+        summer_sum = profile[summer_mask].sum()
+        winter_sum = profile[~summer_mask].sum()
+        # The masks partition the profile, so the seasons add up to the annual total
+        total = summer_sum + winter_sum
+
+        if not math.isclose(total, 0):
+            summer_weight = Q_(summer_sum / total, '')
+            winter_weight = Q_(winter_sum / total, '')
             return summer_weight, winter_weight
         else:
             return Q_(0, ''), Q_(0, '')
 
     def monthly_demand_peaks(self, dem_profile=None):
-        month_list = self.meter_months_hourly
-        month_demand_list = []
-        monthly_peak_list = []
-        for index, item in enumerate(month_list):
-            if index == 0 or month_list[index] == month_list[index - 1]:
-                month_demand_list.append(dem_profile[index])
-            else:
-                monthly_peak_list.append(max(month_demand_list))
-                month_demand_list = list()
-                month_demand_list.append(dem_profile[index])
-        return monthly_peak_list
+        # The final run is the hour that rolls over into the next year, which is not a full month
+        profile = np.asarray(dem_profile.magnitude)
+        monthly_peaks = np.maximum.reduceat(profile, self.meter_month_starts_hourly)[:-1]
+        return Q_(monthly_peaks, dem_profile.units)
 
     def monthly_energy_sums(self, dem_profile=None):
-        month_list = self.meter_months_hourly
-        month_demand_list = []
-        monthly_sum_list = []
-
-        # Check units, convert energy list to power list
-        if dem_profile[0].check('[energy]'):
-            i = (dem_profile[0] / Q_(1, ureg.hours)).to_reduced_units()
-            units_to = i.units
-            dem_profile = self.convert_units(values_list=dem_profile, units_to_str=str(units_to))
-
-        for index, item in enumerate(month_list):
-            if index == 0 or month_list[index] == month_list[index - 1]:
-                month_demand_list.append(dem_profile[index])
-            else:
-                energy_sum = sum(month_demand_list) * Q_(1, ureg.hours)
-                energy_sum.ito_reduced_units()
-                monthly_sum_list.append(energy_sum)
-                month_demand_list = list()
-                month_demand_list.append(dem_profile[index])
-        return monthly_sum_list
-
-
-class Emissions(EnergyDemand):
-    def __init__(self, file_name, city, state, grid_efficiency, summer_start_inclusive, winter_start_inclusive,
-                 sim_ab_efficiency):
+        # Check units, convert energy units to power units
+        if dem_profile.check('[energy]'):
+            power_units = (Q_(1, dem_profile.units) / Q_(1, ureg.hours)).units
+        else:
+            power_units = dem_profile.units
+        energy_units = (Q_(1, power_units) * Q_(1, ureg.hours)).to_reduced_units().units
+
+        # Each hourly value covers a one hour time step, so the monthly energy is the sum of the
+        # magnitudes. The final run is the hour that rolls over into the next year.
+        profile = np.asarray(dem_profile.magnitude)
+        monthly_sums = np.add.reduceat(profile, self.meter_month_starts_hourly)[:-1]
+        return Q_(monthly_sums, energy_units)
+
+
+class Emissions:
+    # NG Emissions
+    NG_CO2 = 14.43 * (ureg.kg / ureg.megaBtu)
+
+    # Average Emissions (accounts for losses)
+    AVG_EMISSIONS = {
+        "seattle, wa": Q_(662.5, ureg.lbs / ureg.MWh),
+        "helena, mt": Q_(662.5, ureg.lbs / ureg.MWh),
+        "great falls, mt": Q_(662.5, ureg.lbs / ureg.MWh),
+        "miami, fl": Q_(870.4, ureg.lbs / ureg.MWh),
+        "duluth, mn": Q_(1040.6, ureg.lbs / ureg.MWh),
+        "international falls, mn": Q_(1040.6, ureg.lbs / ureg.MWh),
+        "phoenix, az": Q_(855.8, ureg.lbs / ureg.MWh),
+        "tucson, az": Q_(855.8, ureg.lbs / ureg.MWh),
+        "fairbanks, ak": Q_(1114.7, ureg.lbs / ureg.MWh),
+        "chicago, il": Q_(1093.2, ureg.lbs / ureg.MWh),
+        "buffalo, ny": Q_(243.6, ureg.lbs / ureg.MWh),
+        "honolulu, hi": Q_(1711.5, ureg.lbs / ureg.MWh)
+    }
+
+    def __init__(self):
         """
         Stores emission intensity values for natural gas and from electricity sub-grids
         for each of the 7 accepted locations.
         """
-        super().__init__(file_name, city, state, grid_efficiency, summer_start_inclusive, winter_start_inclusive,
-                         sim_ab_efficiency)
-
-        # NG Emissions
-        self.ng_co2 = 14.43 * (ureg.kg / ureg.megaBtu)
-
-        # Average Emissions (accounts for losses)
-        self.avg_emissions = {
-            "seattle, wa": Q_(662.5, ureg.lbs / ureg.MWh),
-            "helena, mt": Q_(662.5, ureg.lbs / ureg.MWh),
-            "great falls, mt": Q_(662.5, ureg.lbs / ureg.MWh),
-            "miami, fl": Q_(870.4, ureg.lbs / ureg.MWh),
-            "duluth, mn": Q_(1040.6, ureg.lbs / ureg.MWh),
-            "international falls, mn": Q_(1040.6, ureg.lbs / ureg.MWh),
-            "phoenix, az": Q_(855.8, ureg.lbs / ureg.MWh),
-            "tucson, az": Q_(855.8, ureg.lbs / ureg.MWh),
-            "fairbanks, ak": Q_(1114.7, ureg.lbs / ureg.MWh),
-            "chicago, il": Q_(1093.2, ureg.lbs / ureg.MWh),
-            "buffalo, ny": Q_(243.6, ureg.lbs / ureg.MWh),
-            "honolulu, hi": Q_(1711.5, ureg.lbs / ureg.MWh)
-        }
-
-
-class EnergyCosts(EnergyDemand):
-    def __init__(self, file_name, city, state, grid_efficiency, summer_start_inclusive, winter_start_inclusive,
-                 sim_ab_efficiency, meter_type_el=None, meter_type_fuel=None, schedule_type_el=None, no_apts=None,
+        # Shared class-level values, built once at import
+        self.ng_co2 = Emissions.NG_CO2
+        self.avg_emissions = Emissions.AVG_EMISSIONS
+
+
+class EnergyCosts:
+    def __init__(self, meter_type_el=None, meter_type_fuel=None, schedule_type_el=None, no_apts=None,
                  master_metered_el=None, single_metered_el=None, master_metered_fuel=None, single_metered_fuel=None,
                  schedule_type_fuel=None,):
         """
@@ -333,8 +372,6 @@ class EnergyCosts(EnergyDemand):
             contains number of apartments in the building. Used when calculating
             monthly and annual base costs.
         """
-        super().__init__(file_name, city, state, grid_efficiency, summer_start_inclusive, winter_start_inclusive,
-                         sim_ab_efficiency)
 
         #####################################
         # Electricity Charges
@@ -354,9 +391,8 @@ class EnergyCosts(EnergyDemand):
         self.single_meter_fuel_dict = single_metered_fuel
 
 
-class CHP(EnergyDemand):
-    def __init__(self, file_name, city, state, grid_efficiency, summer_start_inclusive, winter_start_inclusive,
-                 sim_ab_efficiency, turn_down_ratio=None, chp_installed_cost=None, chp_om_cost=None):
+class CHP:
+    def __init__(self, turn_down_ratio=None, chp_installed_cost=None, chp_om_cost=None):
         """
         This class defines the specifications and costs of the CHP system.
 
@@ -374,11 +410,8 @@ class CHP(EnergyDemand):
             decimal percentage of capacity (ie: 50% is 0.5) before being stored.
         """
 
-        super().__init__(file_name, city, state, grid_efficiency, summer_start_inclusive, winter_start_inclusive,
-                         sim_ab_efficiency)
-
         # CHP Units
-        self.chp_size_units = ureg.kW
+        self.chp_size_units = _KW
 
         # CHP Specifications
         try:
@@ -388,13 +421,12 @@ class CHP(EnergyDemand):
         self.min_pl = chp_min_pl
 
         # Labor, material, and installation costs (installed cost)
-        self.installed_cost = chp_installed_cost * 1/ureg.kW
-        self.om_cost = chp_om_cost * 1/ureg.kWh
+        self.installed_cost = chp_installed_cost * 1/_KW
+        self.om_cost = chp_om_cost * 1/_KWH
 
 
-class TES(EnergyDemand):
-    def __init__(self, file_name, city, state, grid_efficiency, summer_start_inclusive, winter_start_inclusive,
-                 sim_ab_efficiency, start=None, tes_installed_cost=None, tes_om_cost=None):
+class TES:
+    def __init__(self, start=None, tes_installed_cost=None, tes_om_cost=None):
         """
         This class defines the specifications and costs of the TES (thermal energy storage) system.
 
@@ -409,23 +441,20 @@ class TES(EnergyDemand):
             contains the annual operation and maintenance cost for the TES units based on energy in/out.
             Units are in $/kWh.
         """
-        super().__init__(file_name, city, state, grid_efficiency, summer_start_inclusive, winter_start_inclusive,
-                         sim_ab_efficiency)
 
         # Units
-        self.tes_size_units = ureg.Btu
+        self.tes_size_units = _BTU
 
         # TES Specifications
         self.start = float(start)
 
         # TES Materials Costs
-        self.installed_cost = float(tes_installed_cost) * (1/ureg.kWh)
-        self.om_cost = float(tes_om_cost) * (1/ureg.kWh)
+        self.installed_cost = float(tes_installed_cost) * (1/_KWH)
+        self.om_cost = float(tes_om_cost) * (1/_KWH)
 
 
-class AuxBoiler(EnergyDemand):
-    def __init__(self, file_name, city, state, grid_efficiency, summer_start_inclusive, winter_start_inclusive,
-                 sim_ab_efficiency, efficiency=None):
+class AuxBoiler:
+    def __init__(self, efficiency=None):
         """
         This class defines the specifications of the Auxiliary Boiler.
 
@@ -435,8 +464,6 @@ class AuxBoiler(EnergyDemand):
             The efficiency of the boiler when operating at full load expressed
             as a decimal value (ie: 50% = 0.5). Dimensionless
         """
-        super().__init__(file_name, city, state, grid_efficiency, summer_start_inclusive, winter_start_inclusive,
-                         sim_ab_efficiency)
 
         # Aux Boiler Specifications
         self.eff = efficiency
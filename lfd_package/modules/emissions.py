@@ -20,12 +20,13 @@ def identify_subgrid_coefficients(class_dict=None):
     subgrid_coefficient_average: Quantity
         contains the desired subgrid emission intensity value to use in emission calculations for the given location.
     """
-    if class_dict is not None:
-        emissions_class = class_dict['emissions']
+    if class_dict is None:
+        raise TypeError("identify_subgrid_coefficients() missing a required argument")
+    emissions_class = class_dict['emissions']
 
-        dict_key = "{}, {}".format(emissions_class.city, emissions_class.state)
-        subgrid_coefficient_average = emissions_class.avg_emissions[dict_key]
-        return subgrid_coefficient_average
+    dict_key = "{}, {}".format(class_dict['demand'].city, class_dict['demand'].state)
+    subgrid_coefficient_average = emissions_class.avg_emissions[dict_key]
+    return subgrid_coefficient_average
 
 
 def calc_baseline_grid_emissions(class_dict=None):
@@ -42,16 +43,15 @@ def calc_baseline_grid_emissions(class_dict=None):
     electric_emissions_annual_avg: Quantity
         the annual sum of electrical emissions for the Baseline case in units of lbs.
     """
-    if class_dict is not None:
-        emissions_class = class_dict['emissions']
+    if class_dict is None:
+        raise TypeError("calc_baseline_grid_emissions() missing a required argument")
+    subgrid_coefficient_average = identify_subgrid_coefficients(class_dict=class_dict)
+    electric_demand_annual = class_dict['demand'].annual_sum_el
+    assert electric_demand_annual.units == ureg.kWh
 
-        subgrid_coefficient_average = identify_subgrid_coefficients(class_dict=class_dict)
-        electric_demand_annual = emissions_class.annual_sum_el
-        assert electric_demand_annual.units == ureg.kWh
+    electric_emissions_annual_avg = (electric_demand_annual * subgrid_coefficient_average).to('lbs')
 
-        electric_emissions_annual_avg = (electric_demand_annual * subgrid_coefficient_average).to('lbs')
-
-        return electric_emissions_annual_avg
+    return electric_emissions_annual_avg
 
 
 def calc_baseline_fuel_emissions(class_dict=None):
@@ -68,16 +68,17 @@ def calc_baseline_fuel_emissions(class_dict=None):
     fuel_emissions_annual: Quantity
         the annual sum of fuel CO2 emissions for the Baseline case in units of lbs.
     """
-    if class_dict is not None:
-        emissions_class = class_dict['emissions']
+    if class_dict is None:
+        raise TypeError("calc_baseline_fuel_emissions() missing a required argument")
+    emissions_class = class_dict['emissions']
 
-        heating_demand_annual = emissions_class.annual_sum_hl
-        assert heating_demand_annual.units == ureg.Btu
+    heating_demand_annual = class_dict['demand'].annual_sum_hl
+    assert heating_demand_annual.units == ureg.Btu
 
-        fuel_emissions_annual = (heating_demand_annual * emissions_class.ng_co2).to('lbs')
-        assert fuel_emissions_annual.units == ureg.lbs
+    fuel_emissions_annual = (heating_demand_annual * emissions_class.ng_co2).to('lbs')
+    assert fuel_emissions_annual.units == ureg.lbs
 
-        return fuel_emissions_annual
+    return fuel_emissions_annual
 
 
 def calc_chp_emissions(electricity_bought_annual=None, chp_fuel_use_annual=None, ab_fuel_use_annual=None,
@@ -102,15 +103,16 @@ def calc_chp_emissions(electricity_bought_annual=None, chp_fuel_use_annual=None,
     total_emissions_avg: Quantity
         the sum of annual electrical and fuel CO2 emissions for the energy system (CHP+Boiler) in units of lbs.
     """
-    args_list = [electricity_bought_annual, chp_fuel_use_annual, ab_fuel_use_annual, class_dict]
-    if any(elem is None for elem in args_list) is False:
+    if (electricity_bought_annual is None or chp_fuel_use_annual is None or ab_fuel_use_annual is None or
+            class_dict is None):
+        raise TypeError("calc_chp_emissions() missing a required argument")
 
-        subgrid_coefficient_avg = identify_subgrid_coefficients(class_dict=class_dict)
+    subgrid_coefficient_avg = identify_subgrid_coefficients(class_dict=class_dict)
 
-        chp_fuel_emissions = (class_dict['emissions'].ng_co2 * chp_fuel_use_annual).to('lbs')
-        boiler_emissions = (class_dict['emissions'].ng_co2 * ab_fuel_use_annual).to('lbs')
+    chp_fuel_emissions = (class_dict['emissions'].ng_co2 * chp_fuel_use_annual).to('lbs')
+    boiler_emissions = (class_dict['emissions'].ng_co2 * ab_fuel_use_annual).to('lbs')
 
-        grid_emissions_avg = (subgrid_coefficient_avg * electricity_bought_annual).to('lbs')
-        total_emissions_avg = grid_emissions_avg + chp_fuel_emissions + boiler_emissions
+    grid_emissions_avg = (subgrid_coefficient_avg * electricity_bought_annual).to('lbs')
+    total_emissions_avg = grid_emissions_avg + chp_fuel_emissions + boiler_emissions
 
-        return total_emissions_avg
+    return total_emissions_avg
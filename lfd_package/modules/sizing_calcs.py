@@ -28,16 +28,13 @@ def create_demand_curve_array(array=None):
         1D array of energy demand data associated with the percent-days data. Contains
         Quantity values.
     """
-    if array is not None:
-        assert array.ndim == 1
-        reverse_sort_array = np.sort(array, axis=0)
-        sorted_demand_array = reverse_sort_array[::-1]
-        percent_days = []
-        for i, k in enumerate(array):
-            percent = ((i+1) / len(array))*100
-            percent_days.append(percent)
-        percent_days_array = np.array(percent_days)
-        return percent_days_array, sorted_demand_array
+    if array is None:
+        raise TypeError("create_demand_curve_array() missing a required argument")
+    assert array.ndim == 1
+    reverse_sort_array = np.sort(array, axis=0)
+    sorted_demand_array = reverse_sort_array[::-1]
+    percent_days_array = (np.arange(1, len(array) + 1) / len(array))*100
+    return percent_days_array, sorted_demand_array
 
 
 def electrical_output_to_fuel_consumption(electrical_output=None):
@@ -51,24 +48,21 @@ def electrical_output_to_fuel_consumption(electrical_output=None):
 
     Parameters
     ----------
-    electrical_output: Quantity (float)
+    electrical_output: Quantity (float or numpy.ndarray)
         Electrical output of CHP in units of kW
 
     Returns
     -------
-    fuel_consumption_kw: Quantity (float)
+    fuel_consumption_kw: Quantity (float or numpy.ndarray)
         Approximate fuel consumption of CHP in units of kW thermal
     """
-    if electrical_output is not None:
-        assert electrical_output.units == ureg.kW
+    if electrical_output is None:
+        raise TypeError("electrical_output_to_fuel_consumption() missing a required argument")
+    assert electrical_output.units == ureg.kW
 
-        if electrical_output.magnitude == 0:
-            return Q_(0, ureg.kW)
-        else:
-            a = 3.6376
-            assert electrical_output.units == ureg.kW
-            fuel_consumption_kw = (a * electrical_output.magnitude) * ureg.kW
-            return fuel_consumption_kw
+    a = 3.6376
+    fuel_consumption_kw = (a * electrical_output.magnitude) * ureg.kW
+    return fuel_consumption_kw
 
 
 def electrical_output_to_thermal_output(electrical_output=None):
@@ -85,23 +79,21 @@ def electrical_output_to_thermal_output(electrical_output=None):
 
     Parameters
     ----------
-    electrical_output: Quantity (float)
+    electrical_output: Quantity (float or numpy.ndarray)
         Electrical output of CHP in units of kW
 
     Returns
     -------
-    thermal_output_kw: Quantity (float)
+    thermal_output_kw: Quantity (float or numpy.ndarray)
         Approximate thermal output of CHP in units of kW
     """
-    if electrical_output is not None:
-        assert electrical_output.units == ureg.kW
+    if electrical_output is None:
+        raise TypeError("electrical_output_to_thermal_output() missing a required argument")
+    assert electrical_output.units == ureg.kW
 
-        if electrical_output.magnitude == 0:
-            return Q_(0, ureg.kW)
-        else:
-            a = 1.8721
-            thermal_output_kw = (a * electrical_output.magnitude) * ureg.kW
-            return thermal_output_kw
+    a = 1.8721
+    thermal_output_kw = (a * electrical_output.magnitude) * ureg.kW
+    return thermal_output_kw
 
 
 def thermal_output_to_electrical_output(thermal_output=None):
@@ -116,26 +108,22 @@ def thermal_output_to_electrical_output(thermal_output=None):
 
     Parameters
     ----------
-    thermal_output: Quantity (float)
+    thermal_output: Quantity (float or numpy.ndarray)
         Thermal output of CHP in units of kW (thermal)
 
     Returns
     -------
-    electrical_output_kw: Quantity (float)
+    electrical_output_kw: Quantity (float or numpy.ndarray)
         Approximate electrical output of CHP in units of kW
     """
-    if thermal_output is not None:
-        assert thermal_output.units == ureg.kW
+    if thermal_output is None:
+        raise TypeError("thermal_output_to_electrical_output() missing a required argument")
+    assert thermal_output.units == ureg.kW
 
-        if thermal_output.magnitude == 0:
-            return Q_(0, ureg.kW)
-        else:
-            a = 0.5188
-            electrical_output_kw = (thermal_output.magnitude * a) * ureg.kW
-            if electrical_output_kw.magnitude <= 0:
-                return Q_(0, ureg.kW)
-            else:
-                return electrical_output_kw
+    a = 0.5188
+    # Negative outputs are clipped to zero
+    electrical_output_kw = np.maximum(thermal_output.magnitude * a, 0) * ureg.kW
+    return electrical_output_kw
 
 
 def size_chp(load_following_type=None, class_dict=None):
@@ -160,23 +148,23 @@ def size_chp(load_following_type=None, class_dict=None):
     chp_size: Quantity (float)
         Recommended size of CHP system in units of kW
     """
-    args_list = [load_following_type, class_dict]
-    if any(elem is None for elem in args_list) is False:
-        if load_following_type == "Peak":
-            chp_size = class_dict['demand'].annual_peak_el
-        elif load_following_type == "ELF":
-            chp_size = calc_max_rect_chp_size(array=class_dict['demand'].el)
-        elif load_following_type == "TLF":
-            thermal_size = (calc_max_rect_chp_size(array=class_dict['demand'].hl)).to(ureg.kW)
-            chp_size = thermal_output_to_electrical_output(thermal_output=thermal_size)
-        else:
-            raise Exception("Error in size_chp function in module sizing_calcs.py")
+    if load_following_type is None or class_dict is None:
+        raise TypeError("size_chp() missing a required argument")
+    if load_following_type == "Peak":
+        chp_size = class_dict['demand'].annual_peak_el
+    elif load_following_type == "ELF":
+        chp_size = calc_max_rect_chp_size(array=class_dict['demand'].el)
+    elif load_following_type == "TLF":
+        thermal_size = (calc_max_rect_chp_size(array=class_dict['demand'].hl)).to(ureg.kW)
+        chp_size = thermal_output_to_electrical_output(thermal_output=thermal_size)
+    else:
+        raise Exception("Error in size_chp function in module sizing_calcs.py")
 
-        # Convert units
-        if chp_size.units != ureg.kW:
-            chp_size.to(ureg.kW)
+    # Convert units
+    if chp_size.units != ureg.kW:
+        chp_size = chp_size.to(ureg.kW)
 
-        return chp_size
+    return chp_size
 
 
 def calc_max_rect_chp_size(array=None):
@@ -198,13 +186,14 @@ def calc_max_rect_chp_size(array=None):
         The recommended size (either thermal or electrical) of the CHP system. Units
         will be either kW or Btu/hr.
     """
-    if array is not None:
-        assert array.ndim == 1
-        percent_days_array, sorted_demand_array = create_demand_curve_array(array=array)
-        prod_array = np.multiply(percent_days_array, sorted_demand_array)
-        max_index = np.argmax(prod_array)
-        max_value = sorted_demand_array[max_index]
-        return max_value
+    if array is None:
+        raise TypeError("calc_max_rect_chp_size() missing a required argument")
+    assert array.ndim == 1
+    percent_days_array, sorted_demand_array = create_demand_curve_array(array=array)
+    prod_array = np.multiply(percent_days_array, sorted_demand_array)
+    max_index = np.argmax(prod_array)
+    max_value = sorted_demand_array[max_index]
+    return max_value
 
 
 def size_tes(chp_size=None, class_dict=None):
@@ -226,66 +215,28 @@ def size_tes(chp_size=None, class_dict=None):
     tes_size_btu: Quantity
         Recommended thermal storage size in units of Btu.
     """
-    args_list = [chp_size, class_dict]
-    if any(elem is None for elem in args_list) is False:
-        # Create empty lists
-        uncovered_heat_demand_hourly = []
-        daily_uncovered_heat_btu_list = []
-        excess_chp_heat_gen_hourly = []
-        daily_excess_chp_heat_btu_list = []
-        list_comparison_min_values = []
-
-        # For unit management in pint
-        hour_unit = Q_(1, ureg.hour)
-
-        # Pull needed data (assumes CHP runs at constant max generation for sizing purposes)
-        hourly_excess_and_deficit_list = \
-            [(electrical_output_to_thermal_output(chp_size)).to(ureg.Btu / ureg.hour) - dem for dem in
-             class_dict['demand'].hl]
-
-        assert isinstance(hourly_excess_and_deficit_list, list)
-        assert hourly_excess_and_deficit_list[0].units == ureg.Btu / ureg.hour
-
-        # Separate data into excess generation list and uncovered demand list
-        for index, element in enumerate(hourly_excess_and_deficit_list):
-            if element.magnitude <= 0:
-                uncovered_heat_demand_hourly.append(Q_(abs(element.magnitude), element.units))
-                excess_chp_heat_gen_hourly.append(Q_(0, ureg.Btu / ureg.hour))
-            elif 0 < element.magnitude:
-                uncovered_heat_demand_hourly.append(Q_(0, ureg.Btu / ureg.hour))
-                excess_chp_heat_gen_hourly.append(Q_(abs(element.magnitude), element.units))
-            else:
-                raise Exception('Error in sizing_calcs.py function, size_tes()')
-
-        # Turn hourly lists into daily sums
-        assert len(uncovered_heat_demand_hourly) == len(excess_chp_heat_gen_hourly)
-        for index in range(24, len(uncovered_heat_demand_hourly) + 1, 24):
-            daily_uncovered_heat_btu_hour = sum(uncovered_heat_demand_hourly[(index - 24):index])
-            daily_uncovered_heat_btu = (daily_uncovered_heat_btu_hour * hour_unit).to(ureg.Btu)
-            daily_uncovered_heat_btu_list.append(daily_uncovered_heat_btu)
-
-            daily_excess_heat_btu_hour = sum(excess_chp_heat_gen_hourly[(index - 24):index])
-            daily_excess_heat_btu = (daily_excess_heat_btu_hour * hour_unit).to(ureg.Btu)
-            daily_excess_chp_heat_btu_list.append(daily_excess_heat_btu)
-
-        # Compare the two lists and pick the min for each day
-        assert len(daily_excess_chp_heat_btu_list) == len(daily_uncovered_heat_btu_list)
-        for index in range(len(daily_excess_chp_heat_btu_list)):
-            if daily_excess_chp_heat_btu_list[index] <= daily_uncovered_heat_btu_list[index]:
-                list_comparison_min_values.append(daily_excess_chp_heat_btu_list[index])
-            elif daily_uncovered_heat_btu_list[index] < daily_excess_chp_heat_btu_list[index]:
-                list_comparison_min_values.append(daily_uncovered_heat_btu_list[index])
-            else:
-                raise Exception('Error in sizing_calcs.py function, size_tes()')
-
-        assert len(list_comparison_min_values) == len(daily_excess_chp_heat_btu_list)
-
-        # Search the resulting list of min values for the maximum, aka the TES size
-        tes_size_btu = max(list_comparison_min_values)
-        assert list_comparison_min_values[0].units == ureg.Btu
-        assert tes_size_btu.units == ureg.Btu
-
-        if 0 <= tes_size_btu.magnitude:
-            return tes_size_btu
-        else:
-            raise Exception('TES size is negative - error in size_tes() function')
+    if chp_size is None or class_dict is None:
+        raise TypeError("size_tes() missing a required argument")
+    # Pull needed data (assumes CHP runs at constant max generation for sizing purposes)
+    chp_heat_rate_cap = (electrical_output_to_thermal_output(chp_size)).to(ureg.Btu / ureg.hour).magnitude
+    hourly_excess_and_deficit = chp_heat_rate_cap - class_dict['demand'].hl_btu_hr
+
+    # Separate data into excess generation and uncovered demand
+    uncovered_heat_demand_hourly = np.where(hourly_excess_and_deficit <= 0, abs(hourly_excess_and_deficit), 0)
+    excess_chp_heat_gen_hourly = np.where(0 < hourly_excess_and_deficit, hourly_excess_and_deficit, 0)
+
+    # Turn hourly values into daily sums. Over one hour, Btu/hr is numerically equal to Btu
+    no_days = len(hourly_excess_and_deficit) // 24
+    daily_uncovered_heat_btu = uncovered_heat_demand_hourly[:no_days * 24].reshape(no_days, 24).sum(axis=1)
+    daily_excess_chp_heat_btu = excess_chp_heat_gen_hourly[:no_days * 24].reshape(no_days, 24).sum(axis=1)
+
+    # Compare the two and pick the min for each day
+    daily_min_values = np.minimum(daily_excess_chp_heat_btu, daily_uncovered_heat_btu)
+
+    # Search the resulting min values for the maximum, aka the TES size
+    tes_size_btu = Q_(daily_min_values.max(), ureg.Btu)
+
+    if 0 <= tes_size_btu.magnitude:
+        return tes_size_btu
+    else:
+        raise Exception('TES size is negative - error in size_tes() function')
@@ -0,0 +1,56 @@
+"""
+Tests for the EnergyDemand class in lfd_package/modules/classes.py
+"""
+
+import pathlib
+import numpy as np
+import pandas as pd
+import pytest
+import yaml
+from lfd_package.modules import classes
+from lfd_package.modules.__init__ import ureg, Q_
+
+INPUT_YAML = pathlib.Path(__file__).resolve().parent.parent / 'lfd_package' / 'input_yaml' / 'seattle_wa.yaml'
+
+
+@pytest.fixture(scope='module')
+def demand():
+    with open(INPUT_YAML) as f:
+        data = yaml.safe_load(f)
+    return classes.EnergyDemand(file_name=data['demand_filename'], city=data['city'], state=data['state'],
+                                grid_efficiency=data['grid_efficiency'], sim_ab_efficiency=data['energy_plus_eff'],
+                                summer_start_inclusive=data['summer_start_inclusive'],
+                                winter_start_inclusive=data['winter_start_inclusive'])
+
+
+def test_parse_meter_months_rolls_hour_24_into_next_month(demand):
+    # Profiles are typical years with no Feb 29, so Feb 28 24:00 is always the first hour of March
+    dates = pd.Series([" 01/31  23:00:00", " 01/31  24:00:00", " 02/28  24:00:00", " 04/30  24:00:00",
+                       " 06/15  24:00:00", " 12/31  24:00:00"])
+    months = demand.parse_meter_months(date_series=dates)
+    assert months.dtype == np.int8
+    np.testing.assert_array_equal(months, [1, 2, 3, 5, 6, 1])
+
+
+
+def test_convert_units_power_to_energy(demand):
+    power = Q_(np.array([1.5, 2.0, 0.0]), ureg.kW)
+    energy = demand.convert_units(values_list=power, units_to_str="kWh")
+    assert energy.units == ureg.kWh
+    np.testing.assert_allclose(energy.magnitude, [1.5, 2.0, 0.0])
+
+    # Values are returned in the requested units, not just the product with one hour
+    energy_btu = demand.convert_units(values_list=power, units_to_str="Btu")
+    assert energy_btu.units == ureg.Btu
+    np.testing.assert_allclose(energy_btu.magnitude, power.to(ureg.Btu / ureg.hour).magnitude)
+
+
+def test_convert_units_energy_to_power(demand):
+    energy = [Q_(3412.14, ureg.Btu), Q_(0, ureg.Btu)]
+    power = demand.convert_units(values_list=energy, units_to_str="Btu/hr")
+    assert power.units == ureg.Btu / ureg.hour
+    np.testing.assert_allclose(power.magnitude, [3412.14, 0])
+
+    power_kw = demand.convert_units(values_list=energy, units_to_str="kW")
+    assert power_kw.units == ureg.kW
+    np.testing.assert_allclose(power_kw.magnitude, [1.0, 0], atol=1e-5)